@@ -0,0 +1,129 @@
+# bench/loadtest.py — Carga concurrente contra un backend en ejecución (p50/p99 por endpoint)
+#
+# Uso (servidor local con PostgreSQL local y el cache de grids apagado):
+#   GRID_CACHE_SIZE=0 uvicorn main:app --port 8000
+#   python bench/loadtest.py --base http://127.0.0.1:8000 --clients 50 --requests 2000 --out after.json
+#   python bench/loadtest.py ... --baseline before.json   # imprime la diferencia contra otra corrida
+#
+# Cada cliente virtual repite GETs de lectura (grids, resúmenes, listas) hasta completar
+# el total de requests; la latencia se mide por request y se agrega por endpoint.
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+import httpx
+
+ENDPOINTS = [
+    "/api/grid/capacity",
+    "/api/grid/resources-vs",
+    "/api/projects/weekly-avg",
+    "/api/projects/summary",
+    "/api/resources/summary",
+    "/api/resources",
+]
+
+
+def percentile(values, p):
+    if not values:
+        return None
+    values = sorted(values)
+    k = min(len(values) - 1, max(0, round(p / 100 * (len(values) - 1))))
+    return values[k]
+
+
+async def client_loop(client, queue, results, start_monday, weeks):
+    while True:
+        try:
+            path = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        params = None
+        if "grid" in path or "weekly-avg" in path:
+            # arranques distintos para no medir solo aciertos de cache
+            offset = random.randrange(0, 52)
+            params = {"start": str(start_monday + timedelta(days=7 * offset)), "weeks": weeks}
+        t0 = time.perf_counter()
+        try:
+            r = await client.get(path, params=params)
+            failed = r.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        ms = (time.perf_counter() - t0) * 1000
+        results.setdefault(path, {"ms": [], "errors": 0})
+        results[path]["ms"].append(ms)
+        if failed:
+            results[path]["errors"] += 1
+
+
+async def run(args):
+    queue = asyncio.Queue()
+    for i in range(args.requests):
+        queue.put_nowait(ENDPOINTS[i % len(ENDPOINTS)])
+    results = {}
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    async with httpx.AsyncClient(base_url=args.base, timeout=60, limits=limits) as client:
+        t0 = time.perf_counter()
+        await asyncio.gather(*[
+            client_loop(client, queue, results, date.fromisoformat(args.start), args.weeks)
+            for _ in range(args.clients)
+        ])
+        elapsed = time.perf_counter() - t0
+
+    summary = {"clients": args.clients, "requests": args.requests,
+               "elapsed_s": round(elapsed, 3), "throughput_rps": round(args.requests / elapsed, 1),
+               "endpoints": {}}
+    all_ms = []
+    for path, r in sorted(results.items()):
+        all_ms.extend(r["ms"])
+        summary["endpoints"][path] = {
+            "n": len(r["ms"]), "errors": r["errors"],
+            "p50_ms": round(percentile(r["ms"], 50), 2),
+            "p95_ms": round(percentile(r["ms"], 95), 2),
+            "p99_ms": round(percentile(r["ms"], 99), 2),
+            "mean_ms": round(statistics.mean(r["ms"]), 2),
+        }
+    summary["all"] = {"p50_ms": round(percentile(all_ms, 50), 2), "p95_ms": round(percentile(all_ms, 95), 2),
+                      "p99_ms": round(percentile(all_ms, 99), 2)}
+    return summary
+
+
+def print_summary(summary, baseline=None):
+    print(f"{summary['requests']} requests, {summary['clients']} clientes: "
+          f"{summary['throughput_rps']} req/s en {summary['elapsed_s']}s")
+    rows = list(summary["endpoints"].items()) + [("TODOS", summary["all"])]
+    for path, m in rows:
+        line = f"  {path:<28} p50={m['p50_ms']:>8.2f} ms  p95={m['p95_ms']:>8.2f} ms  p99={m['p99_ms']:>8.2f} ms"
+        if m.get("errors"):
+            line += f"  errores={m['errors']}"
+        if baseline:
+            b = baseline["all"] if path == "TODOS" else baseline["endpoints"].get(path)
+            if b:
+                line += f"   (antes p50={b['p50_ms']:.2f} p99={b['p99_ms']:.2f})"
+        print(line)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Load test de endpoints de lectura")
+    ap.add_argument("--base", default="http://127.0.0.1:8000")
+    ap.add_argument("--clients", type=int, default=50)
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--start", default=str(date.today() - timedelta(days=date.today().weekday())))
+    ap.add_argument("--weeks", type=int, default=52)
+    ap.add_argument("--out", help="guardar el resumen en JSON")
+    ap.add_argument("--baseline", help="JSON de una corrida anterior para comparar")
+    args = ap.parse_args()
+
+    summary = asyncio.run(run(args))
+    baseline = json.load(open(args.baseline)) if args.baseline else None
+    print_summary(summary, baseline)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# bench/payload.py — Tamaño y costo de serialización de los grids: formato nested vs columnar
+#
+# Uso (servidor con datos y cache de grids apagado, para medir el cálculo completo):
+#   GRID_CACHE_SIZE=0 uvicorn main:app --port 8000
+#   python bench/payload.py --base http://127.0.0.1:8000 --weeks 52
+#
+# Por cada endpoint y formato mide: bytes sin comprimir, bytes con gzip (lo que viaja con
+# el GZipMiddleware), latencia del servidor, y del lado del cliente json.loads (lo que paga
+# el navegador al parsear) y json.dumps (proxy del costo de serializar en el servidor).
+import argparse
+import json
+import statistics
+import time
+from datetime import date, timedelta
+
+import httpx
+
+ENDPOINTS = ["/api/grid/capacity", "/api/grid/resources-vs"]
+FORMATS = ["nested", "columnar"]
+
+
+def timed(fn, repeat):
+    times, out = [], None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append((time.perf_counter() - t0) * 1000)
+    return out, statistics.median(times)
+
+
+def measure(client, path, fmt, params, repeat):
+    q = {**params, "format": fmt}
+    raw, server_ms = timed(lambda: client.get(path, params=q, headers={"Accept-Encoding": "identity"}), repeat)
+    raw.raise_for_status()
+    gz = client.get(path, params=q, headers={"Accept-Encoding": "gzip"})
+    gz_bytes = int(gz.headers.get("content-length") or len(gz.content))
+    data, loads_ms = timed(lambda: json.loads(raw.content), repeat)
+    _, dumps_ms = timed(lambda: json.dumps(data, ensure_ascii=False, separators=(",", ":")), repeat)
+    return {
+        "bytes": len(raw.content),
+        "gzip_bytes": gz_bytes if gz.headers.get("content-encoding") == "gzip" else len(gz.content),
+        "server_ms": round(server_ms, 2),
+        "json_loads_ms": round(loads_ms, 2),
+        "json_dumps_ms": round(dumps_ms, 2),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark de tamaño/serialización de los grids")
+    ap.add_argument("--base", default="http://127.0.0.1:8000")
+    ap.add_argument("--start", default=str(date.today() - timedelta(days=date.today().weekday())))
+    ap.add_argument("--weeks", type=int, default=52)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    params = {"start": args.start, "weeks": args.weeks}
+    # httpx descomprime solo; content-length conserva el tamaño real en la red
+    with httpx.Client(base_url=args.base, timeout=120) as client:
+        for path in ENDPOINTS:
+            res = {fmt: measure(client, path, fmt, params, args.repeat) for fmt in FORMATS}
+            print(f"=== {path} ({args.weeks} semanas)")
+            for fmt, m in res.items():
+                print(f"  {fmt:<9} {m['bytes'] / 1024:>9.1f} KB  gzip {m['gzip_bytes'] / 1024:>7.1f} KB  "
+                      f"servidor {m['server_ms']:>7.1f} ms  loads {m['json_loads_ms']:>6.1f} ms  "
+                      f"dumps {m['json_dumps_ms']:>6.1f} ms")
+            n, c = res["nested"], res["columnar"]
+            print(f"  columnar/nested: {c['bytes'] / n['bytes']:.2f}x bytes, "
+                  f"{c['gzip_bytes'] / n['gzip_bytes']:.2f}x gzip, "
+                  f"{c['json_loads_ms'] / max(n['json_loads_ms'], 1e-9):.2f}x loads\n")
+
+
+if __name__ == "__main__":
+    main()
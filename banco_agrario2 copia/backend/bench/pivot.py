@@ -0,0 +1,107 @@
+# bench/pivot.py — Pivot de /api/grid/resources-vs: versión con dicts (anterior) vs arrays (actual)
+#
+# Uso:
+#   python bench/pivot.py --people 200 --projects 300 --weeks 52
+#
+# Genera filas sintéticas con la misma forma que devuelve la consulta del endpoint
+# (recurso, tipo, project_id, proyecto, week_monday, pct), mide tiempo (mediana) y pico de
+# memoria (tracemalloc) de cada pivot y verifica que ambos devuelvan exactamente lo mismo.
+# No usa la base: main se importa con DB_INIT=0.
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost:1/bench")
+os.environ["DB_INIT"] = "0"
+import main  # noqa: E402
+
+
+def _empty_bucket(types, labels):
+    return {
+        "loadByTypeWeek": {t: {lb: 0.0 for lb in labels} for t in types},
+        "projectCountByTypeWeek": {t: {lb: 0 for lb in labels} for t in types},
+        "projectNamesByType": {t: [] for t in types},
+    }
+
+
+def pivot_resources_vs_dicts(people, filter_people, rows, labels) -> dict:
+    """Implementación anterior: dicts por persona y búsqueda lineal para deduplicar proyectos."""
+    types = main.VALID_CLASSIFICATIONS
+    by_person = {name: _empty_bucket(types, labels) for name in filter_people}
+    for r in rows:
+        person = r["recurso"]
+        if person not in by_person:
+            by_person[person] = _empty_bucket(types, labels)
+        tipo = r["tipo"] or "Proyecto"
+        project_id = r["project_id"]
+        proj = r["proyecto"] or "-"
+        lb = main.label_excel(r["week_monday"])
+        pct = float(r["pct"] or 0.0)
+        by_person[person]["loadByTypeWeek"][tipo][lb] = by_person[person]["loadByTypeWeek"][tipo].get(lb, 0.0) + pct
+        by_person[person]["projectCountByTypeWeek"][tipo][lb] = by_person[person]["projectCountByTypeWeek"][tipo].get(lb, 0) + 1
+        current_projects = by_person[person]["projectNamesByType"][tipo]
+        if not any(isinstance(p, dict) and p.get("id") == project_id for p in current_projects):
+            current_projects.append({"id": project_id, "name": proj})
+    return {"labels": labels, "types": types, "people": people, "by_person": by_person}
+
+
+def synthetic_rows(n_people, n_projects, n_weeks, per_person, seed=1):
+    """Cada persona trabaja en `per_person` proyectos, cada uno activo en un tramo de semanas."""
+    rnd = random.Random(seed)
+    start = main.monday_of(date(2025, 1, 6))
+    wms, labels = main.build_window(start, n_weeks)
+    people = [f"Recurso {i:03d}" for i in range(n_people)]
+    projects = [(i + 1, f"Proyecto {i:03d}", rnd.choice(main.VALID_CLASSIFICATIONS)) for i in range(n_projects)]
+    rows = []
+    for person in people:
+        for pid, pname, tipo in rnd.sample(projects, per_person):
+            a = rnd.randrange(n_weeks)
+            b = min(n_weeks, a + rnd.randrange(4, n_weeks + 1))
+            for w in range(a, b):
+                rows.append({"recurso": person, "tipo": tipo, "project_id": pid, "proyecto": pname,
+                             "week_monday": wms[w], "pct": rnd.choice([5.0, 10.0, 20.0])})
+    return people, rows, labels
+
+
+def measure(fn, args, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn(*args)
+        times.append((time.perf_counter() - t0) * 1000)
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, statistics.median(times), peak / 1024 / 1024
+
+
+def main_():
+    ap = argparse.ArgumentParser(description="Benchmark del pivot resources-vs")
+    ap.add_argument("--people", type=int, default=200)
+    ap.add_argument("--projects", type=int, default=300)
+    ap.add_argument("--weeks", type=int, default=52)
+    ap.add_argument("--per-person", type=int, default=40, help="proyectos por persona")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    people, rows, labels = synthetic_rows(args.people, args.projects, args.weeks, args.per_person)
+    print(f"{len(people)} personas, {args.projects} proyectos, {args.weeks} semanas, {len(rows):,} filas\n")
+
+    before, ms_b, mb_b = measure(pivot_resources_vs_dicts, (people, people, rows, labels), args.repeat)
+    after, ms_a, mb_a = measure(main.pivot_resources_vs, (people, people, rows, labels), args.repeat)
+    assert before == after, "los pivots no coinciden"
+
+    print(f"  dicts (antes):    {ms_b:>8.1f} ms   pico {mb_b:>7.1f} MB")
+    print(f"  arrays (después): {ms_a:>8.1f} ms   pico {mb_a:>7.1f} MB")
+    print(f"  tiempo x{ms_b / ms_a:.1f} más rápido, memoria pico x{mb_a / mb_b:.2f}; resultados idénticos")
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,146 @@
+# bench/reservations.py — Reservas de capacidad concurrentes: sin sobreasignación y sin serializar todo
+#
+# Uso (PostgreSQL local en --url o BENCH_DATABASE_URL; crea sus propios recursos/proyecto y
+# los borra al terminar):
+#   BENCH_DATABASE_URL=postgresql://localhost/bench python bench/reservations.py --bookings 400 --threads 12
+#   python bench/reservations.py --url ... --unlocked    # misma carga validando sin bloquear (como antes)
+#
+# Por cada escenario y cantidad de recursos distintos (--spread 1,4,16) dispara --bookings
+# llamadas a create_assignment desde --threads hilos (cada una en su propia transacción y
+# conexión del pool), sobre unas pocas semanas para forzar choques:
+#   saturado:    20-40% por reserva; la mayoría debe terminar en 409 sin pasar del 100%.
+#   sin saturar: 0.25-0.5% por reserva; todas entran y cada una retiene sus celdas hasta el
+#                commit, así que el throughput muestra cuánto se serializan las reservas.
+# --hold-ms simula la latencia de red hasta la base: cada reserva retiene sus celdas ese tiempo
+# extra antes de seguir (con la base en otra máquina, los viajes restantes hasta el commit).
+# Al final de cada ronda verifica contra assignment_weeks que ninguna (recurso, semana) pase
+# del 100% y que resource_week_load cuadre.
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import target  # noqa: E402
+
+target.use_bench_database()
+import main  # noqa: E402
+
+
+def unlocked_totals(s, keys):
+    """Validación anterior: lee la carga sin bloquear (dos reservas pueden pasar a la vez)."""
+    return main.load_weekly_totals(s, {rid for rid, _ in keys}, {wm for _, wm in keys})
+
+
+def hold_after_reserve(ms: float):
+    """Envuelve la reserva para retener las celdas `ms` milisegundos más."""
+    reserve = main.reserve_weekly_totals
+
+    def wrapped(s, keys):
+        out = reserve(s, keys)
+        time.sleep(ms / 1000)
+        return out
+    main.reserve_weekly_totals = wrapped
+
+
+def book(args):
+    rid, pid, start, n, pct = args
+    payload = main.AssignmentIn(project_id=pid, resource_id=rid, start_week_monday=start,
+                                end_week_monday=start + timedelta(weeks=n - 1), subprocess="General",
+                                can_ordinal=1, percentage=pct)
+    try:
+        main.create_assignment(payload)
+        return "ok"
+    except main.HTTPException as e:
+        return str(e.status_code)
+    except Exception as e:   # noqa: BLE001 — se reporta como error del escenario
+        return type(e).__name__
+
+
+def check(rids) -> dict:
+    """Carga máxima real (assignment_weeks) y celdas sobre el 100% o descuadradas."""
+    with main.SessionLocal() as s:
+        rows = s.execute(main.text(f"""
+            SELECT resource_id, week_monday, SUM(speculative_pct) AS pct
+            FROM {main.AW_ALL} aw WHERE resource_id = ANY(:rids)
+            GROUP BY resource_id, week_monday
+        """), {"rids": rids, **main.CAL_BOUNDS}).all()
+        drift = [d for d in main.resource_week_load_drift(s) if d["resource_id"] in set(rids)]
+    over = [r for r in rows if float(r.pct) > main.CAPACITY_LIMIT + 1e-6]
+    return {"max_pct": max((float(r.pct) for r in rows), default=0.0), "over": len(over), "drift": len(drift)}
+
+
+SCENARIOS = {"saturado": (20.0, 30.0, 40.0), "sin saturar": (0.25, 0.5)}
+
+
+def run_round(spread, pcts, args, pid, first, rnd):
+    with main.SessionLocal() as s:
+        rids = s.execute(
+            main.insert(main.Resource).returning(main.Resource.id, sort_by_parameter_order=True),
+            [{"name": f"Reserva {time.time_ns()} {i}", "unit": "bench"} for i in range(spread)]
+        ).scalars().all()
+        s.commit()
+    jobs = [(rids[i % spread], pid, first + timedelta(weeks=rnd.randrange(args.weeks)),
+             rnd.randrange(1, 4), rnd.choice(pcts))
+            for i in range(args.bookings)]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(args.threads) as pool:
+        outcomes = list(pool.map(book, jobs))
+    elapsed = time.perf_counter() - t0
+    result = {"spread": spread, "seconds": round(elapsed, 3),
+              "bookings_per_s": round(len(jobs) / elapsed, 1),
+              "outcomes": {k: outcomes.count(k) for k in sorted(set(outcomes))}, **check(rids)}
+    for rid in rids:
+        main.delete_resource(rid)
+    return result
+
+
+def main_():
+    ap = argparse.ArgumentParser(description="Stress de reservas de capacidad concurrentes")
+    ap.add_argument("--bookings", type=int, default=400, help="reservas por ronda")
+    ap.add_argument("--threads", type=int, default=12, help="hilos (<= DB_POOL_SIZE + DB_MAX_OVERFLOW)")
+    ap.add_argument("--spread", default="1,4,16", help="recursos distintos por ronda, separados por coma")
+    ap.add_argument("--weeks", type=int, default=4, help="semanas en las que caen las reservas")
+    ap.add_argument("--hold-ms", type=float, default=20, help="latencia simulada con las celdas bloqueadas")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--unlocked", action="store_true", help="validar sin bloquear (comportamiento anterior)")
+    ap.add_argument("--url", help="base de benchmarks (por defecto BENCH_DATABASE_URL)")
+    args = ap.parse_args()
+
+    if args.unlocked:
+        main.reserve_weekly_totals = unlocked_totals
+    if args.hold_ms > 0:
+        hold_after_reserve(args.hold_ms)
+    rnd = random.Random(args.seed)
+    first = main.monday_of(date.today()) + timedelta(weeks=1)
+    with main.SessionLocal() as s:
+        pid = s.execute(main.insert(main.Project).returning(main.Project.id), {
+            "name": f"Reservas {time.time_ns()}", "classification": "Proyecto",
+            "phase": "Ejecución", "complexity": "Baja"}).scalar_one()
+        s.commit()
+
+    mode = "sin bloqueo" if args.unlocked else "con reserva por (recurso, semana)"
+    print(f"{args.bookings} reservas por ronda, {args.threads} hilos, {args.weeks} semanas, "
+          f"{args.hold_ms:g} ms retenidas, {mode}\n")
+    failed = False
+    try:
+        for name, pcts in SCENARIOS.items():
+            print(f"{name}:")
+            for spread in [int(x) for x in args.spread.split(",")]:
+                r = run_round(spread, pcts, args, pid, first, rnd)
+                failed |= r["over"] > 0 or r["drift"] > 0
+                outcomes = ", ".join(f"{k}={v}" for k, v in r["outcomes"].items())
+                print(f"  {spread:>3} recursos: {r['seconds']:>7.2f} s  {r['bookings_per_s']:>7.1f} reservas/s  "
+                      f"carga máx {r['max_pct']:>5.1f}%  sobre 100%: {r['over']:>3}  descuadre: {r['drift']}  "
+                      f"[{outcomes}]")
+    finally:
+        main.delete_project(pid)
+    print("\nFALLA: hay semanas sobre el 100% o descuadradas" if failed else "\nOK: ninguna semana sobre el 100%")
+    sys.exit(1 if failed and not args.unlocked else 0)
+
+
+if __name__ == "__main__":
+    main_()
@@ -0,0 +1,126 @@
+# bench/seed.py — Datos sintéticos reproducibles para benchmarks (PostgreSQL local)
+#
+# Uso (la base se indica con --url o BENCH_DATABASE_URL; DATABASE_URL no se usa):
+#   BENCH_DATABASE_URL=postgresql://localhost/bench python bench/seed.py --reset --resources 100 \
+#       --projects 300 --assignments 3000 --weeks 156 --seed 7
+#
+# Usa los modelos reales (Resource, Project) y el mismo camino de escritura que los endpoints
+# (bulk_insert_assignments: assignments + assignment_weeks o assignment_intervals según
+# ASSIGNMENT_STORAGE + resource_week_load, en una transacción). Las asignaciones respetan el
+# límite de capacidad por (recurso, semana), así que los endpoints de escritura se comportan
+# como con datos reales. Misma semilla y mismos parámetros sobre una base vacía => mismos
+# datos. Con --reset vacía las tablas antes de sembrar; solo si la base es local (localhost o
+# socket unix) o con --i-know.
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import target  # noqa: E402
+
+target.use_bench_database()
+import main  # noqa: E402
+
+TABLES = ("assignment_weeks", "assignment_intervals", "assignments", "resource_week_load", "projects", "resources")
+PHASES = ("Planeación", "Ejecución", "Cierre")
+COMPLEXITIES = ("Alta", "Media", "Baja")
+SUBPROCESSES = ("General", "Requerimientos | Desarrollos", "Pruebas", "Salida a producción")
+BATCH = 2000
+
+
+def seed(resources=100, projects=300, assignments=3000, weeks=156, seed=7, reset=False, today=None,
+         i_know=False) -> dict:
+    """
+    Siembra la base de main.DATABASE_URL. Las semanas van de `weeks`/3 atrás a 2/3 adelante
+    de `today` (por defecto hoy); cada asignación dura entre 4 y 30 semanas. `reset` vacía
+    las tablas antes (solo en una base local, salvo `i_know`).
+    """
+    if reset:
+        target.check_can_truncate(main.DATABASE_URL, i_know)
+    rnd = random.Random(seed)
+    today = main.monday_of(today or date.today())
+    first = today - timedelta(weeks=weeks // 3)
+    t0 = time.perf_counter()
+
+    with main.SessionLocal() as s:
+        if reset:
+            s.execute(main.text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"))
+        # sin --reset los nombres siguen la numeración existente (resources.name es único)
+        base_r, base_p = s.execute(main.text(
+            "SELECT (SELECT count(*) FROM resources), (SELECT count(*) FROM projects)")).one()
+
+        rids = s.execute(
+            main.insert(main.Resource).returning(main.Resource.id, sort_by_parameter_order=True),
+            [{"name": f"Recurso {base_r + i:04d}", "unit": f"Unidad {i % 8}"} for i in range(resources)]
+        ).scalars().all()
+        projs = s.execute(
+            main.insert(main.Project).returning(main.Project.id, main.Project.classification,
+                                                main.Project.complexity, sort_by_parameter_order=True),
+            [{"name": f"Proyecto {base_p + i:04d}", "classification": rnd.choice(main.VALID_CLASSIFICATIONS),
+              "phase": rnd.choice(PHASES), "complexity": rnd.choice(COMPLEXITIES)} for i in range(projects)]
+        ).all()
+
+        load = {}       # (recurso, lunes) -> % ya asignado
+        specs, created, skipped = [], 0, 0
+        for _ in range(assignments):
+            pid, cls, cx = rnd.choice(projs)
+            n = rnd.randrange(4, 31)
+            start = first + timedelta(weeks=rnd.randrange(max(weeks - n, 1)))
+            wms = [start + timedelta(weeks=k) for k in range(n)]
+            pct = float(rnd.choice((5, 10, 15, 20, 25)))
+            # hasta 5 intentos de encontrar un recurso con espacio en todas las semanas
+            for _ in range(5):
+                rid = rnd.choice(rids)
+                if all(load.get((rid, wm), 0.0) + pct <= main.CAPACITY_LIMIT for wm in wms):
+                    break
+            else:
+                skipped += 1
+                continue
+            for wm in wms:
+                load[(rid, wm)] = load.get((rid, wm), 0.0) + pct
+            specs.append({
+                "project_id": pid, "resource_id": rid,
+                "start_week_monday": wms[0], "end_week_monday": wms[-1],
+                "subprocess": rnd.choice(SUBPROCESSES), "can_ordinal": rnd.randrange(1, 4),
+                "classification": cls, "complexity": cx,
+                "weeks": [(wm, pct) for wm in wms],
+            })
+            if len(specs) >= BATCH:
+                created += len(main.bulk_insert_assignments(s, specs))
+                specs = []
+        created += len(main.bulk_insert_assignments(s, specs))
+        s.commit()
+        n_weeks = s.execute(main.text(f"SELECT count(*) FROM {main.AW_ALL}"), main.CAL_BOUNDS).scalar()
+
+    with main.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(main.text(f"VACUUM ANALYZE {', '.join(TABLES)}"))
+    main.notify_data_changed()
+
+    return {
+        "resources": len(rids), "projects": len(projs), "assignments": created,
+        "assignment_weeks": n_weeks, "skipped_over_capacity": skipped,
+        "first_week": str(first), "last_week": str(first + timedelta(weeks=weeks - 1)),
+        "seed": seed, "seconds": round(time.perf_counter() - t0, 2),
+    }
+
+
+def main_():
+    ap = argparse.ArgumentParser(description="Siembra datos sintéticos para benchmarks")
+    ap.add_argument("--resources", type=int, default=100)
+    ap.add_argument("--projects", type=int, default=300)
+    ap.add_argument("--assignments", type=int, default=3000)
+    ap.add_argument("--weeks", type=int, default=156, help="semanas del horizonte")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--reset", action="store_true", help="vaciar las tablas antes de sembrar")
+    target.add_target_args(ap)
+    args = ap.parse_args()
+    stats = seed(args.resources, args.projects, args.assignments, args.weeks, args.seed,
+                 reset=args.reset, i_know=args.i_know)
+    print(", ".join(f"{k}={v}" for k, v in stats.items()))
+
+
+if __name__ == "__main__":
+    main_()
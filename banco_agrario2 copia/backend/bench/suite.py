@@ -0,0 +1,320 @@
+# bench/suite.py — Suite de rendimiento: todos los endpoints de main.py, carga HTTP y baseline JSON
+#
+# Uso (PostgreSQL local en --url o BENCH_DATABASE_URL; el cache de grids se apaga para medir
+# el cálculo completo):
+#   export BENCH_DATABASE_URL=postgresql://localhost/bench
+#   python bench/suite.py --seed --reset --out base.json
+#   ... cambios ...
+#   python bench/suite.py --seed --reset --out after.json --baseline base.json
+#
+#   # además, carga concurrente contra un servidor ya levantado (y su RSS pico):
+#   python bench/suite.py --http http://127.0.0.1:8000 --server-pid $(pgrep -f "uvicorn main:app") ...
+#
+# En proceso, cada endpoint se llama --repeat veces con TestClient (las escrituras crean y
+# luego borran sus propios datos, así el dataset no cambia entre corridas). Por ruta se
+# registran n, errores, p50/p95/p99 y throughput; además el RSS pico del proceso. Con
+# --baseline imprime la diferencia por ruta y, con --fail-on-regression, sale con código 1
+# si algún p95 empeora más que --threshold.
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("GRID_CACHE_SIZE", "0")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import openpyxl  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+import target  # noqa: E402
+
+target.use_bench_database()
+import main  # noqa: E402
+import loadtest  # noqa: E402
+import seed as seed_mod  # noqa: E402
+
+DOC_ROUTES = {"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json"}
+
+
+class Driver:
+    """Llama a la app y acumula la latencia por 'MÉTODO /ruta/{plantilla}'."""
+    def __init__(self, client: TestClient):
+        self.client = client
+        self.ms = {}
+        self.errors = {}
+
+    def call(self, key: str, url: str, **kw):
+        method = key.split(" ", 1)[0]
+        t0 = time.perf_counter()
+        r = self.client.request(method, url, **kw)
+        ms = (time.perf_counter() - t0) * 1000
+        self.ms.setdefault(key, []).append(ms)
+        if r.status_code >= 400:
+            self.errors[key] = self.errors.get(key, 0) + 1
+            print(f"  ! {key} -> {r.status_code}: {r.text[:200]}", file=sys.stderr)
+        return r
+
+
+def import_file(tag: str, rows: int) -> bytes:
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["NOMBRE", "RECURSO", "CLASIFICA", "FASE", "COMPLEJIDAD", "LUNES", "%", "SUBPROCESO"])
+    monday = main.monday_of(date.today()) + timedelta(weeks=400)
+    for i in range(rows):
+        ws.append([f"Bench import {tag}", f"Bench import {tag}", "Proyecto", "Ejecución", "Media",
+                   monday + timedelta(weeks=i % 20), 5, "General"])
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def read_scenarios(d: Driver, ctx: dict, rnd: random.Random):
+    w = {"start": ctx["start"], "weeks": ctx["weeks"]}
+    d.call("GET /", "/")
+    d.call("OPTIONS /api/{rest_of_path:path}", "/api/resources")
+    for path in ("/api/debug/tables", "/api/debug/cache", "/api/debug/pool", "/api/debug/requests",
+                 "/api/debug/changes", "/metrics"):
+        d.call(f"GET {path}", path)
+    d.call("GET /api/resources", "/api/resources")
+    d.call("GET /api/projects", "/api/projects")
+    d.call("GET /api/assignments", "/api/assignments", params={"limit": 500})
+    d.call("GET /api/assignment-weeks", "/api/assignment-weeks", params={"limit": 500})
+    d.call("GET /api/assignments/{assignment_id}/weeks", f"/api/assignments/{rnd.choice(ctx['assignment_ids'])}/weeks")
+    d.call("GET /api/projects/summary", "/api/projects/summary")
+    d.call("GET /api/resources/summary", "/api/resources/summary")
+    d.call("GET /api/projects/with-assignments", "/api/projects/with-assignments")
+    d.call("GET /api/weeks/window", "/api/weeks/window", params=w)
+    d.call("GET /api/grid/capacity", "/api/grid/capacity", params=w)
+    d.call("GET /api/grid/resources-vs", "/api/grid/resources-vs", params=w)
+    d.call("GET /api/projects/weekly-avg", "/api/projects/weekly-avg", params=w)
+    d.call("GET /api/dashboard", "/api/dashboard", params=w)
+    d.call("GET /api/projects/{project_id}/subprocesses/current-month",
+           f"/api/projects/{rnd.choice(ctx['project_ids'])}/subprocesses/current-month")
+    d.call("GET /api/schedules/{complexity}", f"/api/schedules/{rnd.choice(['alta', 'media'])}")
+    d.call("POST /api/planning/suggest", "/api/planning/suggest",
+           json={"start_date": ctx["start"], "complexity": "Media", "top_n": 10})
+    d.call("GET /api/export/capacity.xlsx", "/api/export/capacity.xlsx", params=w)
+    d.call("GET /api/export/assignments.csv", "/api/export/assignments.csv",
+           params={"resource_id": rnd.choice(ctx["resource_ids"])})
+
+
+def write_scenarios(d: Driver, ctx: dict, i: int):
+    """Crea un recurso y un proyecto propios, les asigna de todas las formas y borra todo."""
+    far = main.monday_of(date.today()) + timedelta(weeks=300)
+    tag = f"{os.getpid()}-{i}"
+    rid = d.call("POST /api/resources", "/api/resources", json={"name": f"Bench {tag}", "unit": "Bench"}).json()["id"]
+    pid = d.call("POST /api/projects", "/api/projects", json={
+        "name": f"Bench {tag}", "classification": "Proyecto", "phase": "Ejecución", "complexity": "Media"}).json()["id"]
+    aid = d.call("POST /api/assignments", "/api/assignments", json={
+        "project_id": pid, "resource_id": rid, "start_week_monday": str(far),
+        "end_week_monday": str(far + timedelta(weeks=11)), "subprocess": "General", "can_ordinal": 1,
+        "percentage": 10}).json()["id"]
+    d.call("POST /api/assignments/bulk", "/api/assignments/bulk", json={
+        "project_id": pid, "resource_id": rid, "percentages": [10] * 20,
+        "start_date": str(far + timedelta(weeks=20))})
+    d.call("POST /api/assignments/bulk-with-subprocesses", "/api/assignments/bulk-with-subprocesses", json={
+        "project_id": pid, "resource_id": rid, "percentages": [10] * 20, "subprocesses": ["General"] * 20,
+        "start_date": str(far + timedelta(weeks=40))})
+    d.call("POST /api/assignments/schedule", "/api/assignments/schedule", json={
+        "project_id": pid, "resource_id": rid, "start_date": str(far), "complexity": "media",
+        "placement": "auto", "horizon_weeks": 104})
+    d.call("POST /api/import/excel", "/api/import/excel",
+           files={"file": ("bench.xlsx", import_file(tag, 200))})
+    d.call("POST /api/batch", "/api/batch", json={"operations": [
+        {"op": "update", "assignment_id": aid, "percentage": 5, "subprocess": "Pruebas"},
+        *({"op": "create", "project_id": pid, "resource_id": rid, "subprocess": "General", "can_ordinal": 1,
+           "start_week_monday": str(far + timedelta(weeks=60 + k)),
+           "end_week_monday": str(far + timedelta(weeks=60 + k)), "percentage": 10} for k in range(20))]})
+    d.call("DELETE /api/assignments/{assignment_id}", f"/api/assignments/{aid}")
+    d.call("DELETE /api/projects/{project_id}", f"/api/projects/{pid}")
+    d.call("DELETE /api/resources/{resource_id}", f"/api/resources/{rid}")
+    # lo que creó la importación
+    with main.SessionLocal() as s:
+        imp_p = s.execute(main.text("SELECT id FROM projects WHERE name = :n"), {"n": f"Bench import {tag}"}).scalar()
+        imp_r = s.execute(main.text("SELECT id FROM resources WHERE name = :n"), {"n": f"Bench import {tag}"}).scalar()
+    if imp_p:
+        d.call("DELETE /api/projects/{project_id}", f"/api/projects/{imp_p}")
+    if imp_r:
+        d.call("DELETE /api/resources/{resource_id}", f"/api/resources/{imp_r}")
+
+
+def summarize(ms_by_route: dict, errors: dict) -> dict:
+    out = {}
+    for key, ms in sorted(ms_by_route.items()):
+        out[key] = {
+            "n": len(ms), "errors": errors.get(key, 0),
+            "p50_ms": round(loadtest.percentile(ms, 50), 2),
+            "p95_ms": round(loadtest.percentile(ms, 95), 2),
+            "p99_ms": round(loadtest.percentile(ms, 99), 2),
+            "mean_ms": round(statistics.mean(ms), 2),
+            "throughput_rps": round(len(ms) / (sum(ms) / 1000), 1) if sum(ms) else None,
+        }
+    return out
+
+
+def run_inproc(args) -> dict:
+    with main.SessionLocal() as s:
+        ctx = {
+            "start": str(main.monday_of(date.today())), "weeks": args.weeks,
+            "resource_ids": s.execute(main.text("SELECT id FROM resources ORDER BY id")).scalars().all(),
+            "project_ids": s.execute(main.text("SELECT id FROM projects ORDER BY id")).scalars().all(),
+            "assignment_ids": s.execute(main.text("SELECT id FROM assignments ORDER BY id LIMIT 5000")).scalars().all(),
+        }
+    if not (ctx["resource_ids"] and ctx["project_ids"] and ctx["assignment_ids"]):
+        raise SystemExit("La base está vacía: usa --seed o bench/seed.py")
+
+    rnd = random.Random(args.rng_seed)
+    client = TestClient(main.app)
+    client.__enter__()      # un solo event loop para todo (asyncpg)
+    try:
+        d = Driver(client)
+        for _ in range(args.warmup):
+            read_scenarios(d, ctx, rnd)
+        d.ms.clear()
+        d.errors.clear()
+        t0 = time.perf_counter()
+        for i in range(args.repeat):
+            read_scenarios(d, ctx, rnd)
+            write_scenarios(d, ctx, i)
+        elapsed = time.perf_counter() - t0
+    finally:
+        client.__exit__(None, None, None)
+
+    total = sum(len(v) for v in d.ms.values())
+    routes = {f"{m} {r.path}" for r in main.app.routes if getattr(r, "methods", None) and r.path not in DOC_ROUTES
+              for m in r.methods if m != "HEAD"}
+    return {
+        "requests": total, "elapsed_s": round(elapsed, 3), "throughput_rps": round(total / elapsed, 1),
+        # ru_maxrss está en KB en Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "routes": summarize(d.ms, d.errors),
+        "not_covered": sorted(routes - set(d.ms)),
+    }
+
+
+def server_peak_rss_mb(pid: int):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Imprime la diferencia por ruta; devuelve las rutas cuyo p95 empeoró más que threshold."""
+    regressions = []
+    print(f"\nComparación contra {baseline['meta'].get('commit') or 'baseline'} ({baseline['meta'].get('date')})")
+    for section in ("inproc", "http"):
+        cur, base = current.get(section), baseline.get(section)
+        if not cur or not base:
+            continue
+        cur_routes = cur.get("routes") or cur.get("endpoints", {})
+        base_routes = base.get("routes") or base.get("endpoints", {})
+        print(f"  [{section}] throughput {base['throughput_rps']} -> {cur['throughput_rps']} req/s")
+        for key in sorted(set(cur_routes) & set(base_routes)):
+            c, b = cur_routes[key], base_routes[key]
+            if "p95_ms" not in b:
+                continue
+            ratio = c["p95_ms"] / b["p95_ms"] if b["p95_ms"] else 1.0
+            flag = ""
+            # por debajo de 1 ms el ruido domina
+            if ratio > 1 + threshold and c["p95_ms"] - b["p95_ms"] > 1.0:
+                flag = "  <-- REGRESIÓN"
+                regressions.append(f"{section} {key}")
+            print(f"    {key:<62} p95 {b['p95_ms']:>9.2f} -> {c['p95_ms']:>9.2f} ms (x{ratio:.2f}){flag}")
+    return regressions
+
+
+def main_():
+    ap = argparse.ArgumentParser(description="Suite de rendimiento de la API")
+    ap.add_argument("--seed", action="store_true", help="sembrar la base antes de medir")
+    ap.add_argument("--reset", action="store_true", help="con --seed, vaciar las tablas antes de sembrar")
+    ap.add_argument("--resources", type=int, default=100)
+    ap.add_argument("--projects", type=int, default=300)
+    ap.add_argument("--assignments", type=int, default=3000)
+    ap.add_argument("--horizon", type=int, default=156, help="semanas sembradas")
+    ap.add_argument("--data-seed", type=int, default=7)
+    ap.add_argument("--weeks", type=int, default=52, help="ventana de los grids")
+    ap.add_argument("--repeat", type=int, default=10, help="vueltas por endpoint en proceso")
+    ap.add_argument("--warmup", type=int, default=1)
+    ap.add_argument("--rng-seed", type=int, default=1)
+    ap.add_argument("--http", help="URL base de un servidor para la carga concurrente (opcional)")
+    ap.add_argument("--server-pid", type=int, help="pid del servidor para leer su RSS pico")
+    ap.add_argument("--clients", type=int, default=20)
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--out", help="guardar los resultados en JSON")
+    ap.add_argument("--baseline", help="JSON de otra corrida para comparar")
+    ap.add_argument("--threshold", type=float, default=0.2, help="empeoramiento de p95 tolerado (0.2 = 20%%)")
+    ap.add_argument("--fail-on-regression", action="store_true")
+    target.add_target_args(ap)
+    args = ap.parse_args()
+
+    dataset = None
+    if args.seed:
+        dataset = seed_mod.seed(args.resources, args.projects, args.assignments, args.horizon, args.data_seed,
+                                reset=args.reset, i_know=args.i_know)
+        print("Datos:", ", ".join(f"{k}={v}" for k, v in dataset.items()))
+
+    result = {
+        "meta": {
+            "commit": git_commit(), "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(), "cpus": os.cpu_count(),
+            "grid_cache_size": os.environ.get("GRID_CACHE_SIZE"),
+            "grid_pivot_mode": main.GRID_PIVOT_MODE,
+            "dataset": dataset, "args": vars(args),
+        },
+    }
+
+    inproc = run_inproc(args)
+    result["inproc"] = inproc
+    print(f"\nEn proceso: {inproc['requests']} requests en {inproc['elapsed_s']}s "
+          f"({inproc['throughput_rps']} req/s), RSS pico {inproc['peak_rss_mb']} MB")
+    for key, m in inproc["routes"].items():
+        err = f"  errores={m['errors']}" if m["errors"] else ""
+        print(f"  {key:<62} p50={m['p50_ms']:>8.2f}  p95={m['p95_ms']:>8.2f}  p99={m['p99_ms']:>8.2f} ms{err}")
+    if inproc["not_covered"]:
+        print("  sin escenario:", ", ".join(inproc["not_covered"]))
+
+    if args.http:
+        import asyncio
+        lt_args = argparse.Namespace(base=args.http, clients=args.clients, requests=args.requests,
+                                     start=str(main.monday_of(date.today())), weeks=args.weeks)
+        http = asyncio.run(loadtest.run(lt_args))
+        if args.server_pid:
+            http["server_peak_rss_mb"] = server_peak_rss_mb(args.server_pid)
+        result["http"] = http
+        print("\nHTTP:")
+        loadtest.print_summary(http)
+        if http.get("server_peak_rss_mb") is not None:
+            print(f"  RSS pico del servidor: {http['server_peak_rss_mb']} MB")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(result, json.load(f), args.threshold)
+        if regressions and args.fail_on_regression:
+            print(f"\n{len(regressions)} rutas empeoraron más de {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_()
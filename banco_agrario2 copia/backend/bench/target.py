@@ -0,0 +1,44 @@
+# bench/target.py — Base de datos objetivo de los benchmarks que importan main
+#
+# main lee DATABASE_URL al importarse, así que los scripts llaman a use_bench_database()
+# ANTES de `import main`: toma --url o BENCH_DATABASE_URL (nunca el DATABASE_URL heredado
+# del entorno, que puede ser el de la aplicación) y lo deja en DATABASE_URL para main.
+import argparse
+import os
+import sys
+
+from sqlalchemy.engine import make_url
+
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+def add_target_args(ap: argparse.ArgumentParser):
+    """--url y --i-know en el parser del script (para --help y para que no queden sin reconocer)."""
+    ap.add_argument("--url", help="base de benchmarks (por defecto BENCH_DATABASE_URL)")
+    ap.add_argument("--i-know", action="store_true",
+                    help="permitir vaciar tablas en una base que no está en localhost")
+
+
+def use_bench_database() -> str:
+    pre = argparse.ArgumentParser(add_help=False)
+    pre.add_argument("--url", default=os.getenv("BENCH_DATABASE_URL"))
+    url = pre.parse_known_args(sys.argv[1:])[0].url
+    if not url:
+        raise SystemExit("Indica --url o BENCH_DATABASE_URL")
+    os.environ["DATABASE_URL"] = url
+    return url
+
+
+def is_local(url: str) -> bool:
+    """True si la base está en esta máquina (localhost o socket unix)."""
+    u = make_url(url)
+    host = u.host or u.query.get("host") or ""
+    if isinstance(host, tuple):
+        host = host[0]
+    return not host or host.startswith("/") or host in LOCAL_HOSTS
+
+
+def check_can_truncate(url: str, i_know: bool = False):
+    if not (is_local(url) or i_know):
+        raise SystemExit(f"{make_url(url).render_as_string(hide_password=True)} no es una base local: "
+                         "no se vacían sus tablas sin --i-know")
@@ -0,0 +1,73 @@
+# manage.py — Comandos de mantenimiento del backend
+#
+#   python manage.py migrate        # migraciones de una sola vía (antes de desplegar una versión que las pida)
+#   python manage.py rebuild-load   # regenera resource_week_load desde assignment_weeks e intervalos
+#   python manage.py check-load     # reporta celdas de resource_week_load que no cuadran
+#   python manage.py compact-intervals  # pasa asignaciones de % constante a assignment_intervals
+import argparse
+import os
+import sys
+
+# main no prepara la base al importarse: migrate lo hace después de migrar y los demás
+# comandos con create_tables() (que se niega si hay migraciones pendientes)
+os.environ["DB_INIT"] = "0"
+import main  # noqa: E402
+
+
+def cmd_migrate(args):
+    with main.schema_lock():
+        main.create_base_schema()
+        done = main.migrate_assignment_weeks()
+    main.create_tables()
+    print("✅ " + ("; ".join(done) if done else "la base ya estaba al día"))
+
+
+def cmd_rebuild_load(args):
+    with main.SessionLocal() as s:
+        n = main.rebuild_resource_week_load(s)
+        # los totales pueden cambiar: sube la versión de datos y los clientes recargan
+        main.record_change(s, reload=True)
+        s.commit()
+    print(f"✅ resource_week_load reconstruida: {n} celdas")
+
+
+def cmd_check_load(args):
+    with main.SessionLocal() as s:
+        drift = main.resource_week_load_drift(s)
+    if not drift:
+        print("✅ resource_week_load cuadra con las semanas de asignación")
+        return 0
+    print(f"❌ {len(drift)} celdas con diferencias:")
+    for d in drift[:args.limit]:
+        print(f"  recurso={d['resource_id']} semana={d['week_monday']} "
+              f"guardado={d['stored']:.2f} real={d['actual']:.2f}")
+    return 1
+
+
+def cmd_compact_intervals(args):
+    with main.SessionLocal() as s:
+        intervals, weeks = main.compact_assignment_intervals(s)
+        # las cargas no cambian, pero sí las filas debajo: los clientes recargan igual
+        main.record_change(s, reload=True)
+        s.commit()
+    print(f"✅ {intervals} asignaciones pasadas a intervalos ({weeks} filas de assignment_weeks menos)")
+
+
+def main_cli():
+    ap = argparse.ArgumentParser(description="Mantenimiento Banco Agrario")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("migrate", help="Aplica las migraciones pendientes").set_defaults(fn=cmd_migrate)
+    sub.add_parser("rebuild-load", help="Regenera resource_week_load").set_defaults(fn=cmd_rebuild_load)
+    p = sub.add_parser("check-load", help="Verifica drift de resource_week_load")
+    p.add_argument("--limit", type=int, default=50)
+    p.set_defaults(fn=cmd_check_load)
+    sub.add_parser("compact-intervals", help="Guarda como intervalos las asignaciones de % constante")\
+        .set_defaults(fn=cmd_compact_intervals)
+    args = ap.parse_args()
+    if args.fn is not cmd_migrate:
+        main.create_tables()
+    sys.exit(args.fn(args) or 0)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,114 @@
+# tests/conftest.py — Fixtures comunes
+#
+# Uso (desde backend/):
+#   pip install -r requirements-dev.txt
+#   python -m pytest -q                                         # solo tests sin base
+#   TEST_DATABASE_URL=postgresql://localhost/banco_test python -m pytest -q
+#
+# Los tests que tocan la base usan SOLO TEST_DATABASE_URL (nunca DATABASE_URL): vacían las
+# tablas antes de cada test. Sin TEST_DATABASE_URL esos tests se saltan y main se importa
+# con DB_INIT=0 contra una dirección que no responde.
+import asyncio
+import inspect
+import io
+import logging
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql://localhost:1/banco_sin_base"
+os.environ.setdefault("GRID_CACHE_SIZE", "0")
+os.environ.setdefault("CHANGE_FEED", "0")
+if not TEST_DATABASE_URL:
+    os.environ["DB_INIT"] = "0"
+    os.environ.setdefault("LOG_LEVEL", "CRITICAL")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main  # noqa: E402
+
+logging.getLogger("banco_agrario").setLevel(os.getenv("LOG_LEVEL", "WARNING"))
+
+TABLES = ("assignment_weeks", "assignment_intervals", "assignments", "resource_week_load", "projects", "resources")
+FAR = main.monday_of(date.today()) + timedelta(weeks=300)   # semanas sin carga previa
+
+ROUTES = {(m, r.path): r.endpoint for r in main.app.routes if getattr(r, "methods", None) for m in r.methods}
+
+# un solo event loop para los endpoints async: el pool de asyncpg queda atado al loop que lo creó
+_loop = asyncio.new_event_loop()
+
+
+def run_endpoint(endpoint, **kwargs):
+    result = endpoint(**kwargs)
+    if inspect.isawaitable(result):
+        result = _loop.run_until_complete(result)
+    return result
+
+
+@pytest.fixture
+def db():
+    """Base de tests vacía (las tablas se truncan antes de cada test)."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("requiere TEST_DATABASE_URL")
+    with main.SessionLocal() as s:
+        s.execute(main.text(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE"))
+        s.commit()
+    main.notify_data_changed()
+    yield main
+
+
+@pytest.fixture
+def call_route(db):
+    """
+    Llama al endpoint de (método, ruta) dentro de query_counter() y verifica que no pase su
+    @query_budget (más lo que haya ampliado con extend_query_budget). Devuelve lo que
+    devuelve el endpoint; si levanta HTTPException el presupuesto se verifica igual.
+        body = call_route("POST", "/api/assignments", payload=main.AssignmentIn(...))
+    """
+    def call(method: str, path: str, **kwargs):
+        endpoint = ROUTES[(method, path)]
+        with main.query_counter() as q:
+            try:
+                return run_endpoint(endpoint, **kwargs)
+            finally:
+                budget = endpoint.query_budget + q.budget_extra
+                assert q.sql_count <= budget, (
+                    f"{method} {path}: {q.sql_count} sentencias SQL (presupuesto {budget})\n"
+                    + "\n".join(st["sql"][:160] for st in q.statements)
+                )
+    return call
+
+
+@pytest.fixture
+def make_resource(db):
+    def make(name="Recurso", unit="Unidad"):
+        return main.create_resource(main.ResourceIn(name=name, unit=unit)).id
+    return make
+
+
+@pytest.fixture
+def make_project(db):
+    def make(name="Proyecto", classification="Proyecto", complexity="Baja"):
+        return main.create_project(main.ProjectIn(
+            name=name, classification=classification, phase="Ejecución", complexity=complexity)).id
+    return make
+
+
+def excel_file(rows, header=("NOMBRE", "RECURSO", "CLASIFICA", "FASE", "COMPLEJIDAD", "LUNES", "%", "SUBPROCESO"),
+               pct_format=None):
+    """UploadFile con un .xlsx de importación; pct_format aplica ese number_format a la columna %."""
+    import openpyxl
+    from fastapi import UploadFile
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(list(header))
+    for row in rows:
+        ws.append(list(row))
+        if pct_format:
+            ws.cell(row=ws.max_row, column=header.index("%") + 1).number_format = pct_format
+    buf = io.BytesIO()
+    wb.save(buf)
+    buf.seek(0)
+    return UploadFile(file=buf, filename="import.xlsx")
@@ -0,0 +1,54 @@
+# tests/test_calendar.py — Calendario precalculado, labels y ventanas de semanas (sin base)
+from datetime import date, timedelta
+
+import pytest
+
+from conftest import main
+
+
+def _label(wm):
+    """Cálculo directo del label, sin calendario."""
+    return f"{main.month_label(wm)}:Sem {main.week_index_in_month(wm)}"
+
+
+def test_calendar_labels_match_direct_computation():
+    assert all(lb == _label(wm) for wm, lb in zip(main.CAL_MONDAYS, main.CAL_LABELS))
+    assert main.label_excel(date(2025, 9, 29)) == "Septiembre_25:Sem 5"
+
+
+@pytest.mark.parametrize("wm", [main.CAL_MONDAYS[0] - timedelta(weeks=1), main.CAL_MONDAYS[-1] + timedelta(weeks=1)])
+def test_label_excel_outside_calendar(wm):
+    assert main.week_ordinal(wm) is None
+    assert main.label_excel(wm) == _label(wm)
+
+
+def test_monday_from_label_inverts_label_excel():
+    # el label lleva el año en dos dígitos (2000 + yy): fuera de 2000-2099 es ambiguo
+    for wm in main.CAL_MONDAYS:
+        if not 2000 <= wm.year <= 2099:
+            continue
+        mes, sem = main.label_excel(wm).split(":")
+        assert main.monday_from_label(mes, sem) == wm
+
+
+@pytest.mark.parametrize("mes, semana", [("Septiembre", "Sem 1"), ("Brumario_25", "Sem 1"), ("Enero_25", "Sem 0")])
+def test_monday_from_label_rejects_bad_labels(mes, semana):
+    with pytest.raises(ValueError):
+        main.monday_from_label(mes, semana)
+
+
+@pytest.mark.parametrize("start, weeks", [
+    (date(2025, 9, 3), 12),                                   # miércoles: ventana desde su lunes
+    ("2025-09-01", 52),
+    (main.CAL_MONDAYS[-3], 6),                                # cruza el fin del calendario
+    (main.CAL_MONDAYS[0] - timedelta(weeks=2), 4),            # empieza antes del calendario
+])
+def test_build_window_matches_direct_computation(start, weeks):
+    first = main.monday_of(main.to_date(start))
+    expected = [first + timedelta(weeks=k) for k in range(weeks)]
+    assert main.build_window(start, weeks) == (expected, [_label(wm) for wm in expected])
+
+
+@pytest.mark.parametrize("start, weeks", [("no-es-fecha", 12), (date(2025, 9, 1), 0), (date(2025, 9, 1), -3)])
+def test_build_window_empty(start, weeks):
+    assert main.build_window(start, weeks) == ([], [])
@@ -0,0 +1,54 @@
+# tests/test_calendar_range.py — Semanas fuera del calendario: 422 o fila saltada, nunca un 500
+from datetime import date, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from conftest import FAR, excel_file, main
+
+BEFORE = main.monday_of(date(1999, 6, 7))
+AFTER = main.CAL_MONDAYS[-1] + timedelta(weeks=1)
+
+
+def test_in_calendar_bounds():
+    assert main.in_calendar(main.CAL_MONDAYS[0]) and main.in_calendar(main.CAL_MONDAYS[-1])
+    assert not main.in_calendar(BEFORE) and not main.in_calendar(AFTER)
+    with pytest.raises(HTTPException) as e:
+        main.check_in_calendar(main.CAL_MONDAYS[-1], AFTER)
+    assert e.value.status_code == 422
+
+
+@pytest.mark.parametrize("start", [BEFORE, AFTER])
+def test_create_assignment_outside_calendar_is_422(make_resource, make_project, start):
+    rid, pid = make_resource(), make_project()
+    with pytest.raises(HTTPException) as e:
+        main.create_assignment(main.AssignmentIn(
+            project_id=pid, resource_id=rid, start_week_monday=start, end_week_monday=start,
+            subprocess="General", can_ordinal=1, percentage=10))
+    assert e.value.status_code == 422
+
+
+def test_bulk_running_past_the_calendar_is_422(make_resource, make_project):
+    rid, pid = make_resource(), make_project()
+    with pytest.raises(HTTPException) as e:
+        main.create_bulk_assignments({"project_id": pid, "resource_id": rid, "percentages": [10] * 4,
+                                      "start_date": str(main.CAL_MONDAYS[-2])})
+    assert e.value.status_code == 422
+
+
+def test_batch_operation_outside_calendar_is_422(make_resource, make_project):
+    rid, pid = make_resource(), make_project()
+    with pytest.raises(HTTPException) as e:
+        main.apply_batch(main.BatchIn(operations=[main.BatchOp(
+            op="create", project_id=pid, resource_id=rid, subprocess="General", can_ordinal=1,
+            start_week_monday=AFTER, end_week_monday=AFTER, percentage=10)]))
+    assert e.value.status_code == 422
+    assert "Operación 0" in e.value.detail
+
+
+def test_import_skips_rows_outside_calendar(db):
+    rows = [("Rango", "Rango", "Proyecto", "Ejecución", "Baja", FAR, 10, "General"),
+            ("Rango", "Rango", "Proyecto", "Ejecución", "Baja", AFTER, 10, "General")]
+    out = main.import_excel(excel_file(rows))
+    assert out["stats"]["rows_skipped"] == 1 and out["stats"]["weeks_created"] == 1
+    assert "fuera del calendario" in out["errors"][0]["error"]
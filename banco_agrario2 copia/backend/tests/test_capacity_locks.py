@@ -0,0 +1,64 @@
+# tests/test_capacity_locks.py — Reservas concurrentes de capacidad contra la base de tests
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from conftest import FAR, main
+
+
+def _payload(rid, pid, start, weeks, pct):
+    return main.AssignmentIn(project_id=pid, resource_id=rid, start_week_monday=start,
+                             end_week_monday=start + timedelta(weeks=weeks - 1), subprocess="General",
+                             can_ordinal=1, percentage=pct)
+
+
+def _book(*args):
+    try:
+        main.create_assignment(_payload(*args))
+        return "ok"
+    except HTTPException as e:
+        return e.status_code
+
+
+def test_concurrent_bookings_never_exceed_capacity(make_resource, make_project):
+    """Muchas reservas simultáneas sobre pocas celdas: las que no caben terminan en 409."""
+    rids = [make_resource(f"Concurrente {i}") for i in range(2)]
+    pid = make_project()
+    rnd = random.Random(7)
+    jobs = [(rids[i % 2], pid, FAR + timedelta(weeks=rnd.randrange(3)), rnd.randrange(1, 3),
+             rnd.choice((20.0, 30.0, 40.0))) for i in range(60)]
+    with ThreadPoolExecutor(8) as pool:
+        outcomes = list(pool.map(lambda job: _book(*job), jobs))
+
+    assert set(outcomes) <= {"ok", 409} and outcomes.count(409) > 0
+    with main.SessionLocal() as s:
+        loads = s.execute(main.text(
+            "SELECT resource_id, week_monday, total_pct FROM resource_week_load WHERE resource_id = ANY(:r)"),
+            {"r": rids}).all()
+        assert main.resource_week_load_drift(s) == []
+    assert loads and max(float(r.total_pct) for r in loads) <= main.CAPACITY_LIMIT
+
+
+def test_lock_timeout_gives_up_with_503(make_resource, make_project, monkeypatch):
+    """Con la celda bloqueada por otra transacción, retry_on_lock reintenta lo acordado y responde 503."""
+    rid, pid = make_resource(), make_project()
+    monkeypatch.setattr(main, "CAPACITY_LOCK_TIMEOUT_MS", 50)
+    monkeypatch.setattr(main, "CAPACITY_LOCK_RETRIES", 2)
+    attempts = []
+    lock = main.lock_weekly_totals
+    monkeypatch.setattr(main, "lock_weekly_totals", lambda s, keys: attempts.append(1) or lock(s, keys))
+
+    with main.SessionLocal() as holder:
+        lock(holder, [(rid, FAR)])
+        with pytest.raises(HTTPException) as e:
+            main.create_assignment(_payload(rid, pid, FAR, 1, 10.0))
+        assert e.value.status_code == 503
+        assert len(attempts) == main.CAPACITY_LOCK_RETRIES + 1
+        holder.rollback()
+
+    # liberada la celda, la misma reserva entra
+    assert _book(rid, pid, FAR, 1, 10.0) == "ok"
+
@@ -0,0 +1,31 @@
+# tests/test_cursors.py — Cursores de la paginación keyset (sin base)
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+
+from conftest import main
+
+
+@pytest.mark.parametrize("key, types", [
+    (("Proyecto Ñandú", 42), (str, int)),
+    ((date(2025, 9, 1), 7), (date.fromisoformat, int)),
+    (("", 1), (str, int)),
+])
+def test_cursor_round_trip(key, types):
+    cursor = main.encode_cursor(*key)
+    assert "=" not in cursor and "/" not in cursor and "+" not in cursor   # va en la URL tal cual
+    assert main.decode_cursor(cursor, *types) == key
+
+
+@pytest.mark.parametrize("cursor, types", [
+    ("no-es-base64!", (str, int)),
+    (main.encode_cursor("solo-uno"), (str, int)),           # menos valores que tipos
+    (main.encode_cursor("a", 1, 2), (str, int)),            # más valores que tipos
+    (main.encode_cursor("a", "no-es-entero"), (str, int)),
+    (main.encode_cursor("2025-13-01", 1), (date.fromisoformat, int)),
+])
+def test_invalid_cursor_is_400(cursor, types):
+    with pytest.raises(HTTPException) as e:
+        main.decode_cursor(cursor, *types)
+    assert e.value.status_code == 400
@@ -0,0 +1,118 @@
+# tests/test_data_version.py — Orden de invalidación del cache y avance de la versión de datos
+import pytest
+from sqlalchemy import event, exc
+
+from conftest import FAR, main, run_endpoint
+
+
+@pytest.fixture
+def feed_on(db, monkeypatch):
+    monkeypatch.setattr(main, "CHANGE_FEED", True)
+    calls = []
+    monkeypatch.setattr(main.grid_cache, "invalidate", lambda: calls.append("invalidate"))
+    monkeypatch.setattr(main.change_feed, "advance", lambda version: calls.append(("advance", version)))
+    return calls
+
+
+def _version():
+    with main.engine.connect() as conn:
+        return conn.execute(main.text("SELECT version FROM data_version WHERE id = 1")).scalar()
+
+
+def test_commit_invalidates_grid_cache_before_advancing_version(feed_on, make_resource):
+    """Nadie debe ver la versión nueva mientras el cache todavía tiene grids de la anterior."""
+    rid = make_resource()
+    feed_on.clear()
+    before = _version()
+    with main.SessionLocal() as s:
+        main.record_change(s, resources=[rid])
+        s.commit()
+    assert _version() == before + 1
+    assert feed_on == ["invalidate", ("advance", before + 1)]
+
+
+def test_rollback_publishes_nothing(feed_on):
+    before = _version()
+    with main.SessionLocal() as s:
+        s.execute(main.text("SELECT 1"))
+        main.record_change(s, reload=True)
+        s.rollback()
+        s.commit()
+    assert _version() == before and feed_on == []
+
+
+def test_data_version_is_not_locked_while_the_writer_commits(feed_on, make_resource):
+    """El flush y el COMMIT del que escribe no tienen tomada la fila de data_version."""
+    rid = make_resource()
+    locked = []
+
+    def try_lock(session, flush_context):
+        with main.engine.connect() as other:
+            try:
+                other.execute(main.text("SELECT version FROM data_version WHERE id = 1 FOR UPDATE NOWAIT"))
+                locked.append(False)
+            except exc.OperationalError:
+                locked.append(True)
+            other.rollback()
+
+    with main.SessionLocal() as s:
+        event.listen(s, "after_flush", try_lock)
+        s.get(main.Resource, rid).unit = "Otra"
+        main.record_change(s, resources=[rid])
+        s.commit()
+    assert locked == [False]
+
+
+def test_startup_backfill_bumps_the_version(feed_on, make_resource, make_project):
+    main.create_assignment(main.AssignmentIn(project_id=make_project(), resource_id=make_resource(),
+                                             start_week_monday=FAR, end_week_monday=FAR, subprocess="General",
+                                             can_ordinal=1, percentage=10))
+    with main.engine.begin() as conn:
+        conn.execute(main.text("TRUNCATE resource_week_load"))
+    before = _version()
+    main.backfill_resource_week_load()
+    assert _version() == before + 1
+
+
+def test_failed_publish_drops_the_version_until_the_next_notice():
+    feed = main.ChangeFeed("test")
+    feed.version = 10
+    feed.forget_version()
+    assert feed.version is None
+    feed.advance(9)             # el próximo aviso se sube después del commit que quedó sin versión
+    assert feed.version == 9
+    feed.advance(8)
+    assert feed.version == 9
+
+
+def _get(path, if_none_match=None):
+    """Pasa un GET por DataVersionETag y devuelve (status, headers) de la respuesta."""
+    async def endpoint(scope, receive, send):
+        await main.Response(b"{}", media_type="application/json")(scope, receive, send)
+    sent = []
+    async def send(message):
+        sent.append(message)
+    async def receive():
+        return {"type": "http.request", "body": b""}
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    scope = {"type": "http", "method": "GET", "path": path, "headers": headers, "query_string": b"",
+             "root_path": ""}
+    run_endpoint(main.DataVersionETag(endpoint), scope=scope, receive=receive, send=send)
+    start = sent[0]
+    return start["status"], main.Headers(raw=start["headers"])
+
+
+def test_etag_carries_build_and_data_version(monkeypatch):
+    monkeypatch.setattr(main.change_feed, "current_version", lambda: 5)
+    status, headers = _get("/api/grid/capacity")
+    assert status == 200 and headers["etag"].startswith(f'W/"{main.BUILD_ID}-5-')
+    assert _get("/api/grid/capacity", headers["etag"])[0] == 304
+    # el mismo ETag emitido por otro build ya no valida
+    monkeypatch.setattr(main, "BUILD_ID", "otro-build")
+    assert _get("/api/grid/capacity", headers["etag"])[0] == 200
+
+
+def test_exports_have_no_etag(monkeypatch):
+    monkeypatch.setattr(main.change_feed, "current_version", lambda: 5)
+    status, headers = _get("/api/export/capacity.xlsx", "*")
+    assert status == 200 and "etag" not in headers
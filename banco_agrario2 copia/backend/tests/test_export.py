@@ -0,0 +1,55 @@
+# tests/test_export.py — .xlsx escrito por partes: openpyxl lo lee igual que uno propio
+import io
+
+import openpyxl
+
+from conftest import FAR, _loop, main, run_endpoint
+
+
+def _read(chunks):
+    return openpyxl.load_workbook(io.BytesIO(b"".join(chunks)))
+
+
+def test_xlsx_stream_round_trip():
+    rows = [["CLASIFICA", "RECURSO", "AREA", "Enero_25:Sem 1"],
+            ["Proyecto", "Ñandú <&> \"x\"", None, 12.5],
+            ["Total", "con\x07control", "Unidad", 0.0],
+            [1, 2**31 - 1, -3.25]]
+    wb = _read(main.xlsx_stream("Capacidad", iter(rows), freeze="D2"))
+    ws = wb["Capacidad"]
+    assert ws.freeze_panes == "D2"
+    got = [list(r) for r in ws.iter_rows(values_only=True)]
+    assert got == [rows[0], ["Proyecto", "Ñandú <&> \"x\"", None, 12.5], ["Total", "concontrol", "Unidad", 0],
+                   [1, 2**31 - 1, -3.25, None]]
+
+
+def test_xlsx_stream_sends_chunks_while_reading_rows():
+    consumed = []
+
+    def rows():
+        for i in range(20000):
+            consumed.append(i)
+            yield [f"Recurso {i}", i * 0.5, *(float(k) for k in range(10))]
+    chunks = main.xlsx_stream("Hoja", rows())
+    first = next(chunks)
+    assert first.startswith(b"PK") and len(consumed) < 20000     # salió antes de leer todo
+    rest = list(chunks)
+    assert len(rest) > 1
+    ws = _read([first, *rest])["Hoja"]
+    assert ws.max_row == 20000 and ws.cell(row=20000, column=2).value == 19999 * 0.5
+
+
+def test_capacity_export_is_streamed(make_resource, make_project):
+    rid = make_resource("Ana")
+    main.create_assignment(main.AssignmentIn(project_id=make_project(), resource_id=rid, start_week_monday=FAR,
+                                             end_week_monday=FAR, subprocess="General", can_ordinal=1,
+                                             percentage=40))
+    response = run_endpoint(main.export_capacity_xlsx, start=FAR, weeks=2)
+    assert "content-encoding" not in response.headers
+
+    async def body():
+        return [chunk async for chunk in response.body_iterator]
+    ws = _read(_loop.run_until_complete(body()))["Capacidad"]
+    rows = [list(r) for r in ws.iter_rows(values_only=True)]
+    assert rows[0] == ["CLASIFICA", "RECURSO", "AREA", *main.build_window(FAR, 2)[1]]
+    assert rows[1:] == [["Proyecto", "Ana", "Unidad", 40, 0], ["Total", "Ana", "Unidad", 40, 0]]
@@ -0,0 +1,108 @@
+# tests/test_import_excel.py — Lectura de la columna % y validación de capacidad de la importación
+import threading
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from conftest import FAR, excel_file, main
+
+
+@pytest.mark.parametrize("value, number_format, expected", [
+    (1.0, "0%", 100.0),          # celda con formato porcentaje mostrando 100%
+    (0.5, "0%", 50.0),
+    (0.5, "0.00%", 50.0),
+    (50, "General", 50.0),
+    (0.5, "General", 0.5),       # sin formato porcentaje el número ya está en puntos
+    (1.0, None, 1.0),
+    ("50%", None, 50.0),
+    ("0,5%", None, 0.5),
+    ("25", None, 25.0),
+    (None, "0%", 0.0),
+    ("", None, 0.0),
+])
+def test_parse_pct(value, number_format, expected):
+    assert main._parse_pct(value, number_format) == pytest.approx(expected)
+
+
+def _row(name, week, pct):
+    return (name, name, "Proyecto", "Ejecución", "Baja", FAR + timedelta(weeks=week), pct, "General")
+
+
+def _loads(rid):
+    with main.SessionLocal() as s:
+        rows = s.execute(main.text(
+            "SELECT week_monday, total_pct FROM resource_week_load WHERE resource_id = :r AND total_pct > 0"
+            " ORDER BY week_monday"), {"r": rid}).all()
+    return {r.week_monday: float(r.total_pct) for r in rows}
+
+
+def test_import_reads_percent_formatted_cells(db):
+    out = main.import_excel(excel_file([_row("Formato", 0, 1.0), _row("Formato", 1, 0.5)], pct_format="0%"))
+    assert out["stats"]["assignments_created"] == 1
+    with main.SessionLocal() as s:
+        rid = s.execute(main.text("SELECT id FROM resources WHERE name = 'Formato'")).scalar_one()
+    assert _loads(rid) == {FAR: 100.0, FAR + timedelta(weeks=1): 50.0}
+
+
+def test_import_rejects_overbooking_and_imports_nothing(db, make_resource, make_project):
+    rid = make_resource("Ocupado")
+    pid = make_project("Existente")
+    main.create_assignment(main.AssignmentIn(
+        project_id=pid, resource_id=rid, start_week_monday=FAR, end_week_monday=FAR,
+        subprocess="General", can_ordinal=1, percentage=80))
+
+    rows = [("Nuevo", "Ocupado", "Proyecto", "Ejecución", "Baja", FAR, 30, "General"),
+            ("Nuevo", "Ocupado", "Proyecto", "Ejecución", "Baja", FAR + timedelta(weeks=1), 30, "General")]
+    with pytest.raises(HTTPException) as e:
+        main.import_excel(excel_file(rows))
+    assert e.value.status_code == 409
+    assert [w["week_monday"] for w in e.value.detail["weeks"]] == [str(FAR)]
+    # la transacción completa se deshace: ni el proyecto nuevo ni la semana libre
+    assert _loads(rid) == {FAR: 80.0}
+    with main.SessionLocal() as s:
+        assert s.execute(main.text("SELECT count(*) FROM projects WHERE name = 'Nuevo'")).scalar() == 0
+
+
+def test_import_rows_of_one_file_add_up_against_capacity(db):
+    """Dos filas del mismo recurso y semana en proyectos distintos suman entre sí."""
+    rows = [_row("A", 0, 60), ("B", "A", "Proyecto", "Ejecución", "Baja", FAR, 60, "General")]
+    with pytest.raises(HTTPException) as e:
+        main.import_excel(excel_file(rows))
+    assert e.value.status_code == 409
+
+
+def test_import_survives_a_lock_retry(make_resource, monkeypatch):
+    """La reserva se reintenta antes de crear filas: el rollback del reintento no pierde nada."""
+    rid = make_resource("Disputado")
+    monkeypatch.setattr(main, "CAPACITY_LOCK_TIMEOUT_MS", 100)
+    attempts = []
+    lock = main.lock_weekly_totals
+    monkeypatch.setattr(main, "lock_weekly_totals", lambda s, keys: attempts.append(1) or lock(s, keys))
+
+    holder = main.SessionLocal()
+    lock(holder, [(rid, FAR)])
+    release = threading.Timer(0.15, holder.rollback)     # suelta la celda después del primer intento
+    release.start()
+    try:
+        out = main.import_excel(excel_file([("Nuevo", "Disputado", "Proyecto", "Ejecución", "Baja", FAR, 30, "General")]))
+    finally:
+        release.join()
+        holder.close()
+    assert len(attempts) >= 2
+    assert out["stats"]["projects_created"] == 1 and out["stats"]["assignments_created"] == 1
+    assert _loads(rid) == {FAR: 30.0}
+
+
+def test_import_reports_bad_rows_instead_of_failing(db):
+    """CAN ilegible y nombres más largos que la columna: la fila se salta y se reporta."""
+    header = ("NOMBRE", "RECURSO", "CLASIFICA", "FASE", "COMPLEJIDAD", "LUNES", "%", "SUBPROCESO", "CAN")
+    ok = ("Válido", "Recurso", "Proyecto", "Ejecución", "Baja", FAR, 10, "General", 2)
+    rows = [ok,
+            ok[:8] + ("CAN-2",),
+            ("P" * 201,) + ok[1:],
+            (ok[0], "R" * 121) + ok[2:]]
+    out = main.import_excel(excel_file(rows, header=header))
+    assert out["stats"]["rows_skipped"] == 3 and out["stats"]["assignments_created"] == 1
+    assert [e["row"] for e in out["errors"]] == [3, 4, 5]
+    assert "CAN" in out["errors"][0]["error"]
@@ -0,0 +1,53 @@
+# tests/test_migrations.py — manage.py migrate: assignment_weeks sin labels y con FK a weeks
+from datetime import date
+
+import pytest
+
+from conftest import FAR, main
+
+
+@pytest.fixture
+def legacy_schema(make_resource, make_project):
+    """assignment_weeks como antes de la migración: labels por fila y sin FK a weeks."""
+    rid, pid = make_resource(), make_project()
+    main.create_assignment(main.AssignmentIn(project_id=pid, resource_id=rid, start_week_monday=FAR,
+                                             end_week_monday=FAR, subprocess="General", can_ordinal=1,
+                                             percentage=10))
+    with main.engine.begin() as conn:
+        conn.execute(main.text("ALTER TABLE assignment_weeks DROP CONSTRAINT fk_assignment_weeks_week"))
+        conn.execute(main.text("ALTER TABLE assignment_weeks ADD COLUMN month_label varchar(40) NOT NULL DEFAULT '',"
+                               " ADD COLUMN week_label varchar(20) NOT NULL DEFAULT ''"))
+    try:
+        yield {"rid": rid, "pid": pid}
+    finally:
+        with main.engine.begin() as conn:
+            conn.execute(main.text("DELETE FROM assignment_weeks WHERE week_monday NOT IN (SELECT week_monday FROM weeks)"))
+        main.migrate_assignment_weeks()
+
+
+def test_startup_refuses_pending_migrations(legacy_schema):
+    assert main.pending_migrations() == ["agregar fk_assignment_weeks_week",
+                                         "quitar assignment_weeks.month_label/week_label"]
+    with pytest.raises(RuntimeError, match="manage.py migrate"):
+        main.create_tables()
+
+
+def test_migrate_checks_the_calendar_before_changing_anything(legacy_schema):
+    with main.engine.begin() as conn:      # copia de una fila existente en una semana de 2101
+        conn.execute(main.text("""
+            INSERT INTO assignment_weeks (assignment_id, week_monday, week_friday, speculative_pct, subprocess,
+                                          can_ordinal, project_id, resource_id, created_at)
+            SELECT assignment_id, :w, :w + 4, speculative_pct, subprocess, can_ordinal, project_id, resource_id,
+                   created_at
+            FROM assignment_weeks LIMIT 1
+        """), {"w": date(2101, 1, 3)})
+    with pytest.raises(RuntimeError, match="fuera del calendario"):
+        main.migrate_assignment_weeks()
+    assert len(main.pending_migrations()) == 2      # no aplicó nada
+
+    with main.engine.begin() as conn:
+        conn.execute(main.text("DELETE FROM assignment_weeks WHERE week_monday = :w"), {"w": date(2101, 1, 3)})
+    assert main.migrate_assignment_weeks() == ["agregar fk_assignment_weeks_week", "validar fk_assignment_weeks_week",
+                                               "quitar assignment_weeks.month_label/week_label"]
+    assert main.pending_migrations() == [] and main.migrate_assignment_weeks() == []
+    main.create_tables()
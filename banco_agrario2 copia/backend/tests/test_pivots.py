@@ -0,0 +1,148 @@
+# tests/test_pivots.py — Los distintos caminos de los grids semanales devuelven lo mismo
+import json
+import random
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from conftest import FAR, main, run_endpoint
+
+WMS, LABELS = main.build_window(date(2025, 9, 1), 10)
+PEOPLE = ["Ana", "Beto", "Carla"]
+
+
+def resources_vs_rows(seed=7, n=80):
+    """Filas como las de _grid_resources_vs: tipo/proyecto nulos, proyectos repetidos y un
+    recurso que no está en la lista de personas."""
+    rnd = random.Random(seed)
+    return [{"recurso": rnd.choice(PEOPLE + ["Sin lista"]),
+             "tipo": rnd.choice(main.VALID_CLASSIFICATIONS + [None]),
+             "project_id": (pid := rnd.randrange(1, 6)),
+             "proyecto": None if pid == 5 else f"Proyecto {pid}",
+             "week_monday": rnd.choice(WMS),
+             "pct": rnd.choice([None, 5, 12.5, 30])} for _ in range(n)]
+
+
+def capacity_rows(seed=7):
+    rnd = random.Random(seed)
+    return [(name, wm, rnd.choice([None, 10, 55.5])) for name in PEOPLE for wm in WMS if rnd.random() < 0.6]
+
+
+def test_columnar_capacity_is_the_nested_grid():
+    grid = main.pivot_capacity(PEOPLE, capacity_rows(), LABELS)
+    col = main.columnar_capacity(grid)
+    assert col["labels"] == LABELS and col["resources"] == PEOPLE
+    assert {name: dict(zip(col["labels"], values)) for name, values in zip(col["resources"], col["values"])} \
+        == grid["by_resource"]
+
+
+def test_columnar_resources_vs_is_the_nested_grid():
+    grid = main.pivot_resources_vs(PEOPLE, PEOPLE, resources_vs_rows(), LABELS)
+    col = main.columnar_resources_vs(grid)
+    assert (col["labels"], col["types"], col["people"]) == (grid["labels"], grid["types"], grid["people"])
+    rebuilt = {
+        name: {
+            "loadByTypeWeek": {t: dict(zip(LABELS, col["load"][i][k])) for k, t in enumerate(col["types"])},
+            "projectCountByTypeWeek": {t: dict(zip(LABELS, col["count"][i][k])) for k, t in enumerate(col["types"])},
+            "projectNamesByType": {t: col["projects"][i][k] for k, t in enumerate(col["types"])},
+        }
+        for i, name in enumerate(col["persons"])
+    }
+    assert rebuilt == grid["by_person"]
+
+
+@pytest.mark.parametrize("grid, to_columnar", [
+    ({"labels": LABELS, "by_resource": {}}, main.columnar_capacity),
+    ({"labels": LABELS, "types": main.VALID_CLASSIFICATIONS, "people": [], "by_person": {}},
+     main.columnar_resources_vs),
+])
+def test_columnar_of_an_empty_grid(grid, to_columnar):
+    col = to_columnar(grid)
+    assert col["format"] == "columnar" and col["labels"] == LABELS
+
+
+def dict_pivot_resources_vs(people, filter_people, rows, labels) -> dict:
+    """Pivot de referencia con un dict por (persona, métrica, tipo), como antes del de índices."""
+    types = main.VALID_CLASSIFICATIONS
+    def bucket():
+        return {"loadByTypeWeek": {t: dict.fromkeys(labels, 0.0) for t in types},
+                "projectCountByTypeWeek": {t: dict.fromkeys(labels, 0) for t in types},
+                "projectNamesByType": {t: [] for t in types}}
+    by_person = {name: bucket() for name in filter_people}
+    for r in rows:
+        b = by_person.setdefault(r["recurso"], bucket())
+        tipo, lb = r["tipo"] or "Proyecto", main.label_excel(r["week_monday"])
+        b["loadByTypeWeek"][tipo][lb] += float(r["pct"] or 0.0)
+        b["projectCountByTypeWeek"][tipo][lb] += 1
+        if all(p["id"] != r["project_id"] for p in b["projectNamesByType"][tipo]):
+            b["projectNamesByType"][tipo].append({"id": r["project_id"], "name": r["proyecto"] or "-"})
+    return {"labels": labels, "types": types, "people": people, "by_person": by_person}
+
+
+@pytest.mark.parametrize("seed", range(3))
+@pytest.mark.parametrize("filter_people", [PEOPLE, ["Beto"], []])
+def test_index_pivot_matches_dict_pivot(seed, filter_people):
+    rows = resources_vs_rows(seed)
+    got = main.pivot_resources_vs(PEOPLE, filter_people, rows, LABELS)
+    expected = dict_pivot_resources_vs(PEOPLE, filter_people, rows, LABELS)
+    assert got == expected
+    assert list(got["by_person"]) == list(expected["by_person"])     # mismo orden de personas
+
+
+# ----- Con base: pivots en SQL (GRID_PIVOT_MODE=sql), en Python y el del dashboard -----
+def _by_name(weekly_avg):
+    return {p["name"]: (pytest.approx(p["avg_pct"]), p["by_week"]) for p in weekly_avg["projects"]}
+
+
+@pytest.fixture
+def loaded(make_resource, make_project):
+    """
+    Carga repartida en la ventana (y fuera), un proyecto sin asignaciones y un recurso sin
+    carga. Los % son binarios exactos: las sumas coinciden sin tolerancia en cualquier orden.
+    """
+    rnd = random.Random(3)
+    rids = [make_resource(f"Recurso {i}") for i in range(4)]
+    pids = [make_project(f"Proyecto {i}", classification=c) for i, c in enumerate(main.VALID_CLASSIFICATIONS)]
+    for _ in range(15):
+        start = FAR + timedelta(weeks=rnd.randrange(-2, 10))
+        main.create_assignment(main.AssignmentIn(
+            project_id=rnd.choice(pids[:3]), resource_id=rnd.choice(rids[:3]), start_week_monday=start,
+            end_week_monday=start + timedelta(weeks=rnd.randrange(4)), subprocess="General",
+            can_ordinal=1, percentage=rnd.choice([2.5, 5.0, 7.25])))
+    return FAR, 8
+
+
+def test_sql_pivots_match_python_pivots(loaded):
+    start, weeks = loaded
+    capacity = run_endpoint(main._grid_capacity, start=start, weeks=weeks)
+    weekly_avg = run_endpoint(main._projects_weekly_avg, start=start, weeks=weeks)
+
+    sql_capacity = json.loads(run_endpoint(main._sql_pivot, sql=main.SQL_PIVOT_CAPACITY, start=start, weeks=weeks))
+    assert sql_capacity["labels"] == capacity["labels"]
+    assert sql_capacity["by_resource"] == capacity["by_resource"]
+
+    sql_avg = json.loads(run_endpoint(main._sql_pivot, sql=main.SQL_PIVOT_WEEKLY_AVG, start=start, weeks=weeks))
+    assert sql_avg["labels"] == weekly_avg["labels"]
+    assert _by_name(sql_avg) == _by_name(weekly_avg)
+    avgs = [p["avg_pct"] for p in sql_avg["projects"]]
+    assert avgs == sorted(avgs, reverse=True)
+
+
+def test_dashboard_grids_match_their_endpoints(loaded):
+    start, weeks = loaded
+    dash = run_endpoint(main._dashboard, start=start, weeks=weeks)
+    assert dash["capacity"] == run_endpoint(main._grid_capacity, start=start, weeks=weeks)
+    assert dash["resources_vs"] == run_endpoint(main._grid_resources_vs, start=start, weeks=weeks, resource=None)
+    assert _by_name(dash["weekly_avg"]) == _by_name(
+        run_endpoint(main._projects_weekly_avg, start=start, weeks=weeks))
+
+
+@pytest.mark.parametrize("mode", ["python", "sql"])
+@pytest.mark.parametrize("path", ["/api/grid/capacity", "/api/grid/resources-vs", "/api/projects/weekly-avg",
+                                  "/api/dashboard", "/api/weeks/window"])
+def test_empty_window_is_422_in_both_modes(monkeypatch, mode, path):
+    """weeks=0: antes el pivot SQL lo subía a 1 y el de Python fallaba con 500."""
+    monkeypatch.setattr(main, "GRID_PIVOT_MODE", mode)
+    r = TestClient(main.app).get(path, params={"start": "2025-09-01", "weeks": 0})
+    assert r.status_code == 422 and r.json()["detail"][0]["loc"] == ["query", "weeks"]
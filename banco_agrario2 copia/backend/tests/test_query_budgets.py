@@ -0,0 +1,105 @@
+# tests/test_query_budgets.py — Cada endpoint se mantiene dentro de su @query_budget
+#
+# Los datos tienen varias filas por recurso/proyecto a propósito: una consulta dentro de un
+# loop (N+1) se pasa del presupuesto en cuanto hay más de una.
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException, Response
+
+from conftest import FAR, ROUTES, excel_file, main
+
+DOC_ROUTES = ("/docs", "/redoc", "/openapi.json", "/docs/oauth2-redirect")
+
+
+def test_every_route_declares_a_budget():
+    missing = [f"{m} {path}" for (m, path), endpoint in ROUTES.items()
+               if path not in DOC_ROUTES and getattr(endpoint, "query_budget", None) is None]
+    assert not missing
+
+
+@pytest.fixture
+def planning(make_resource, make_project):
+    """3 recursos, 3 proyectos y 6 asignaciones cruzadas de 4 semanas."""
+    rids = [make_resource(f"Recurso {i}") for i in range(3)]
+    pids = [make_project(f"Proyecto {i}", complexity="Media") for i in range(3)]
+    aids = []
+    for k in range(6):
+        start = FAR + timedelta(weeks=k)
+        aids.append(main.create_assignment(main.AssignmentIn(
+            project_id=pids[k % 3], resource_id=rids[k % 3], start_week_monday=start,
+            end_week_monday=start + timedelta(weeks=3), subprocess="General", can_ordinal=1,
+            percentage=10))["id"])
+    return {"rids": rids, "pids": pids, "aids": aids}
+
+
+def test_read_routes(call_route, planning):
+    w = {"start": FAR, "weeks": 12}
+    call_route("GET", "/api/resources", response=Response())
+    call_route("GET", "/api/projects", response=Response())
+    call_route("GET", "/api/resources", response=Response(), limit=2)
+    call_route("GET", "/api/assignments", response=Response(), limit=500, fmt="json")
+    call_route("GET", "/api/assignment-weeks", response=Response(), limit=500, fmt="json")
+    call_route("GET", "/api/assignments/{assignment_id}/weeks", assignment_id=planning["aids"][0])
+    call_route("GET", "/api/projects/summary")
+    call_route("GET", "/api/resources/summary")
+    call_route("GET", "/api/projects/with-assignments")
+    call_route("GET", "/api/weeks/window", **w)
+    for fmt in ("nested", "columnar"):
+        call_route("GET", "/api/grid/capacity", fmt=fmt, **w)
+        call_route("GET", "/api/grid/resources-vs", fmt=fmt, **w)
+    call_route("GET", "/api/projects/weekly-avg", **w)
+    call_route("GET", "/api/dashboard", start=FAR, weeks=52)
+    call_route("GET", "/api/projects/{project_id}/subprocesses/current-month", project_id=planning["pids"][0])
+    call_route("GET", "/api/schedules/{complexity}", complexity="media")
+    call_route("POST", "/api/planning/suggest",
+               payload=main.SuggestIn(start_date=FAR, complexity="Media", top_n=5))
+    call_route("GET", "/api/export/assignments.csv", resource_id=planning["rids"][0])
+    call_route("GET", "/api/export/capacity.xlsx", **w)
+
+
+def test_write_routes(call_route, planning):
+    rid = call_route("POST", "/api/resources", payload=main.ResourceIn(name="Nuevo")).id
+    pid = call_route("POST", "/api/projects", payload=main.ProjectIn(
+        name="Nuevo", classification="Proyecto", phase="Ejecución", complexity="Media")).id
+    start = FAR + timedelta(weeks=20)
+    aid = call_route("POST", "/api/assignments", payload=main.AssignmentIn(
+        project_id=pid, resource_id=rid, start_week_monday=start, end_week_monday=start + timedelta(weeks=11),
+        subprocess="General", can_ordinal=1, percentage=10))["id"]
+    call_route("POST", "/api/assignments/bulk", payload={
+        "project_id": pid, "resource_id": rid, "percentages": [10] * 20,
+        "start_date": str(start + timedelta(weeks=20))})
+    call_route("POST", "/api/assignments/bulk-with-subprocesses", payload={
+        "project_id": pid, "resource_id": rid, "percentages": [10] * 20, "subprocesses": ["General"] * 20,
+        "start_date": str(start + timedelta(weeks=40))})
+    call_route("POST", "/api/assignments/schedule", payload=main.ScheduleIn(
+        project_id=pid, resource_id=rid, start_date=start, complexity="media", placement="auto"))
+    call_route("POST", "/api/batch", payload=main.BatchIn(operations=[
+        main.BatchOp(op="update", assignment_id=aid, percentage=5),
+        *(main.BatchOp(op="create", project_id=pid, resource_id=rid, subprocess="General", can_ordinal=1,
+                       start_week_monday=start + timedelta(weeks=60 + k),
+                       end_week_monday=start + timedelta(weeks=60 + k), percentage=10) for k in range(10)),
+        main.BatchOp(op="delete", assignment_id=planning["aids"][0]),
+    ]))
+    call_route("POST", "/api/import/excel", file=excel_file(
+        [("Importado", "Importado", "Proyecto", "Ejecución", "Media", FAR + timedelta(weeks=k), 5, "General")
+         for k in range(30)]))
+    call_route("DELETE", "/api/assignments/{assignment_id}", assignment_id=aid)
+    call_route("DELETE", "/api/projects/{project_id}", project_id=planning["pids"][1])
+    call_route("DELETE", "/api/resources/{resource_id}", resource_id=planning["rids"][2])
+
+
+def test_rejected_write_stays_within_budget(call_route, planning):
+    """Un 409 por capacidad también respeta el presupuesto (no relee por semana para armar el error)."""
+    with pytest.raises(HTTPException) as e:
+        call_route("POST", "/api/assignments", payload=main.AssignmentIn(
+            project_id=planning["pids"][0], resource_id=planning["rids"][0], start_week_monday=FAR,
+            end_week_monday=FAR + timedelta(weeks=3), subprocess="General", can_ordinal=1, percentage=95))
+    assert e.value.status_code == 409
+
+
+def test_budget_violation_is_reported(call_route, planning, monkeypatch):
+    """El fixture falla si un endpoint ejecuta más sentencias de las declaradas."""
+    monkeypatch.setattr(ROUTES[("GET", "/api/projects/with-assignments")], "query_budget", 0)
+    with pytest.raises(AssertionError, match="presupuesto 0"):
+        call_route("GET", "/api/projects/with-assignments")
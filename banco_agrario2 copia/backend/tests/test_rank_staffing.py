@@ -0,0 +1,81 @@
+# tests/test_rank_staffing.py — Ranking de recursos y pares de /api/planning/suggest (sin base)
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from conftest import main
+
+
+def _brute_force(load, profile, top_n):
+    """Todas las combinaciones, sin atajos: (índices, pico, media) ordenados por pico y media."""
+    active = profile > 0
+    def score(rows, share):
+        peaks, means = [], []
+        for r in rows:
+            full = load[r, active] + profile[active] * share
+            peaks.append(full.max())
+            means.append(full.mean())
+        return max(peaks), sum(means) / len(means)
+    singles = [((i,), *score([i], 1.0)) for i in range(load.shape[0])]
+    pairs = [((i, j), *score([i, j], 0.5)) for i, j in combinations(range(load.shape[0]), 2)]
+    key = lambda x: (x[1], x[2])
+    return sorted(singles, key=key)[:top_n], sorted(pairs, key=key)[:top_n]
+
+
+def _values(ranked):
+    return [v for _, peak, mean in ranked for v in (peak, mean)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("top_n", [1, 3, 10])
+def test_rank_staffing_matches_brute_force(seed, top_n):
+    rnd = np.random.default_rng(seed)
+    load = rnd.uniform(0, 90, size=(12, 20))
+    profile = np.where(rnd.random(20) < 0.3, 0.0, rnd.uniform(5, 60, size=20))
+    singles, pairs = main.rank_staffing(load, profile, top_n)
+    exp_singles, exp_pairs = _brute_force(load, profile, top_n)
+    assert [idx for idx, _, _ in singles] == [idx for idx, _, _ in exp_singles]
+    assert _values(singles) == pytest.approx(_values(exp_singles))
+    # los pares salen de un subconjunto de candidatos: deben coincidir con probar todos
+    assert [set(idx) for idx, _, _ in pairs] == [set(idx) for idx, _, _ in exp_pairs]
+    assert _values(pairs) == pytest.approx(_values(exp_pairs))
+
+
+def test_weeks_without_profile_do_not_count():
+    load = np.array([[0.0, 95.0],      # ocupado solo en una semana que el perfil no usa
+                     [30.0, 0.0]])
+    profile = np.array([50.0, 0.0])
+    singles, pairs = main.rank_staffing(load, profile, top_n=2)
+    assert singles == [((0,), 50.0, 50.0), ((1,), 80.0, 80.0)]
+    assert pairs == [((0, 1), 55.0, 40.0)]
+
+
+def test_single_resource_has_no_pairs():
+    singles, pairs = main.rank_staffing(np.zeros((1, 3)), np.array([10.0, 10.0, 10.0]), top_n=5)
+    assert singles == [((0,), 10.0, 10.0)] and pairs == []
+    assert main.rank_staffing(np.zeros((3, 3)), np.ones(3), top_n=5, with_pairs=False)[1] == []
+
+
+def test_pairs_tied_on_peak_are_ordered_by_mean():
+    """Con picos empatados el mejor par puede salir de recursos fuera de los N+1 primeros."""
+    load = np.array([[20.0, 20.0, 20.0, 20.0],
+                     [60.0, 0.0, 0.0, 0.0],
+                     [60.0, 0.0, 0.0, 1.0]])
+    profile = np.array([10.0, 10.0, 10.0, 10.0])
+    _, pairs = main.rank_staffing(load, profile, top_n=1)
+    assert [(set(idx), peak, mean) for idx, peak, mean in pairs] == [({1, 2}, 65.0, 20.125)]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("top_n", [1, 3, 10])
+def test_rank_staffing_matches_brute_force_with_coarse_loads(seed, top_n):
+    """Cargas en múltiplos de 5%, como las reales: muchos picos empatados."""
+    rnd = np.random.default_rng(seed)
+    load = rnd.integers(0, 19, size=(15, 12)) * 5.0
+    profile = rnd.choice([0.0, 10.0, 20.0], size=12)
+    profile[0] = 10.0
+    singles, pairs = main.rank_staffing(load, profile, top_n)
+    exp_singles, exp_pairs = _brute_force(load, profile, top_n)
+    assert _values(singles) == pytest.approx(_values(exp_singles))
+    assert _values(pairs) == pytest.approx(_values(exp_pairs))
@@ -1,6 +1,11 @@
+import { useEffect } from "react";
 import { NavLink, Outlet } from "react-router-dom";
+import useBA from "./services/state";
 
 export default function App() {
+  // un solo feed de cambios para toda la app; las páginas leen del store
+  useEffect(() => useBA.getState().startLiveUpdates(), []);
+
   return (
     <div className="min-h-screen grid grid-cols-[220px_1fr]">
       <aside className="bg-[var(--color-ba-green)] text-white p-4">
@@ -1,18 +1,10 @@
 // NewAssignmentFromProject.jsx - VERSIÓN COMPLETA CORREGIDA
 import { useEffect, useMemo, useState } from "react";
-import { getProjects, getResources, createAssignment } from "../../services/api";
+import {
+  getProjects, getResources, createAssignment, getSchedule, createScheduledAssignment
+} from "../../services/api";
 import WeekRangeSelector from "../WeekRangeSelector.jsx";
 
-// Importa las funciones CORREGIDAS de porcentajes y subprocesos
-import { 
-  getHighComplexityData, 
-  getMediumComplexityData,
-  getHighComplexityPercentages, 
-  getMediumComplexityPercentages,
-  getHighComplexitySubprocesses,
-  getMediumComplexitySubprocesses
-} from "../../utils/deliverablesMapping";
-
 // Función auxiliar para calcular la semana de inicio
 function getStartWeek() {
   const today = new Date();
@@ -42,6 +34,9 @@ export default function NewAssignmentFromProject({ onClose, selectedPerson = ""
   const [dateRange, setDateRange] = useState(null);
   const [selectedProject, setSelectedProject] = useState(null);
   const [percentage, setPercentage] = useState(10);
+  // Cronograma de media/alta complejidad (lo expande el backend)
+  const [schedule, setSchedule] = useState(null);
+  const [autoPlacement, setAutoPlacement] = useState(false);
 
   useEffect(() => {
     async function load() {
@@ -95,6 +90,19 @@ export default function NewAssignmentFromProject({ onClose, selectedPerson = ""
     return selectedProject?.complexity?.toLowerCase() === "alta";
   }, [selectedProject]);
 
+  useEffect(() => {
+    const complexity = selectedProject?.complexity?.toLowerCase();
+    if (complexity !== "media" && complexity !== "alta") {
+      setSchedule(null);
+      return;
+    }
+    let cancelled = false;
+    getSchedule(complexity)
+      .then(data => { if (!cancelled) setSchedule(data); })
+      .catch(() => { if (!cancelled) setSchedule(null); });
+    return () => { cancelled = true; };
+  }, [selectedProject]);
+
   const canSubmit = useMemo(() => {
     const baseValidation = projectId && resourceId && !loading;
     
@@ -123,49 +131,18 @@ export default function NewAssignmentFromProject({ onClose, selectedPerson = ""
           percentage: percentage,
         });
       } else if (isMediumComplexityProject || isHighComplexityProject) {
-        // Media o Alta complejidad: usar endpoint NUEVO con subprocesos específicos
-        const percentages = isMediumComplexityProject 
-          ? getMediumComplexityPercentages()
-          : getHighComplexityPercentages();
-        
-        const subprocesses = isMediumComplexityProject
-          ? getMediumComplexitySubprocesses()
-          : getHighComplexitySubprocesses();
-
-        const startDate = getStartWeek();
-        
-        console.log('🚀 Enviando asignación bulk con subprocesos:', {
+        // Media o Alta complejidad: el backend expande el cronograma y, en modo
+        // "auto", elige el primer lunes en el que cabe completo bajo el 100%
+        const result = await createScheduledAssignment({
           project_id: Number(projectId),
           resource_id: Number(resourceId),
-          percentages,
-          subprocesses, // INCLUIR SUBPROCESOS
-          start_date: startDate.toISOString().split('T')[0],
-          complexity_type: isMediumComplexityProject ? 'media' : 'alta'
+          start_date: getStartWeek().toISOString().split('T')[0],
+          placement: autoPlacement ? "auto" : "fixed",
         });
-
-        // Llamar al ENDPOINT NUEVO que acepta subprocesos
-        const response = await fetch('http://localhost:8000/api/assignments/bulk-with-subprocesses', {
-          method: 'POST',
-          headers: {
-            'Content-Type': 'application/json',
-          },
-          body: JSON.stringify({
-            project_id: Number(projectId),
-            resource_id: Number(resourceId),
-            percentages: percentages,
-            subprocesses: subprocesses, // ENVIAR SUBPROCESOS
-            start_date: startDate.toISOString().split('T')[0],
-            complexity_type: isMediumComplexityProject ? 'media' : 'alta'
-          })
-        });
-
-        if (!response.ok) {
-          const errorData = await response.json();
-          throw new Error(errorData.detail || 'Error creando asignaciones múltiples');
-        }
-
-        const result = await response.json();
         console.log('✅ Asignaciones creadas con subprocesos:', result);
+        if (result.weeks_shifted > 0) {
+          alert(`Sin disponibilidad en la fecha inicial: el cronograma empieza el ${result.start_date}.`);
+        }
       } else {
         // Para proyectos sin complejidad específica (fallback)
         const startDate = getStartWeek();
@@ -191,7 +168,8 @@ export default function NewAssignmentFromProject({ onClose, selectedPerson = ""
         const msg = weeks.map(w => `${w.label} (actual ${w.current}%, nuevo ${w.new}%)`).join("\n");
         alert("El recurso no cuenta con disponibilidad:\n" + msg);
       } else {
-        alert("Error creando asignación: " + (err?.message || err?.response?.data?.detail || 'Error desconocido'));
+        const detail = err?.response?.data?.detail;
+        alert("Error creando asignación: " + (detail?.message || detail || err?.message || 'Error desconocido'));
       }
     } finally {
       setLoading(false);
@@ -367,22 +345,31 @@ export default function NewAssignmentFromProject({ onClose, selectedPerson = ""
             Vista previa de subprocesos (primeras 4 semanas):
           </h5>
           <div className="space-y-2 max-h-40 overflow-y-auto">
-            {(isMediumComplexityProject ? getMediumComplexitySubprocesses() : getHighComplexitySubprocesses())
+            {(schedule?.weeks || [])
               .slice(0, 4)
-              .map((subprocess, index) => (
+              .map((week, index) => (
                 <div key={index} className="flex justify-between items-center text-xs p-2 bg-white rounded border">
                   <span className="font-medium">Semana {index + 1}:</span>
-                  <span className="text-blue-600">{subprocess}</span>
+                  <span className="text-blue-600">{week.subprocess}</span>
                   <span className="text-green-600 font-medium">
-                    {(isMediumComplexityProject ? getMediumComplexityPercentages() : getHighComplexityPercentages())[index]}%
+                    {week.percentage}%
                   </span>
                 </div>
               ))
             }
           </div>
           <p className="text-xs text-gray-500 mt-2">
-            Mostrando 4 de {isMediumComplexityProject ? '36' : '48'} semanas totales
+            Mostrando 4 de {schedule?.total_weeks ?? (isMediumComplexityProject ? 36 : 48)} semanas totales
           </p>
+          <label className="flex items-center gap-2 mt-3 text-xs text-gray-700">
+            <input
+              type="checkbox"
+              checked={autoPlacement}
+              onChange={(e) => setAutoPlacement(e.target.checked)}
+              disabled={loading}
+            />
+            Si el recurso no tiene disponibilidad, empezar en la primera semana en la que quepa el cronograma
+          </label>
         </div>
       )}
 
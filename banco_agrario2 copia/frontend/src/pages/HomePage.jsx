@@ -1,6 +1,7 @@
 import { Link } from "react-router-dom";
 import { useState } from "react";
 import { api } from "../services/api"; // Ajusta la ruta según tu estructura
+import useBA from "../services/state";
 
 const Tile = ({ to, title, subtitle, onClick, isButton = false }) => (
   isButton ? (
@@ -69,14 +70,18 @@ export default function HomePage() {
         details: `Proyectos: ${result.stats?.projects_created || 0}, Recursos: ${result.stats?.resources_created || 0}, Asignaciones: ${result.stats?.assignments_created || 0}, Semanas: ${result.stats?.weeks_created || 0}`
       });
       
-      setTimeout(() => {
-        window.location.reload();
-      }, 2000);
+      // Con el feed conectado los grids se actualizan solos; si no, se recargan los datos
+      const { liveConnected, scheduleLiveRefresh } = useBA.getState();
+      if (!liveConnected) scheduleLiveRefresh();
     } else {
       setImportResult({
         type: 'error',
         message: '❌ Error en importación',
-        details: result.detail || result.message || 'Error desconocido'
+        // 409 por capacidad: { message, weeks: [{ resource_id, label, current, new }] }
+        details: result.detail?.weeks
+          ? `${result.detail.message} ${result.detail.weeks.slice(0, 5).map(w => w.label).join(", ")}` +
+            (result.detail.weeks.length > 5 ? ` y ${result.detail.weeks.length - 5} más` : "")
+          : result.detail || result.message || 'Error desconocido'
       });
     }
   } catch (error) {
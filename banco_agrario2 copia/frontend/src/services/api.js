@@ -18,6 +18,37 @@ export const createProject  = (p)  => api.post("/projects", p).then(r => r.data)
 export const createAssignment   = (p)  => api.post("/assignments", p).then(r => r.data);
 export const getAssignmentWeeks = (id) => api.get(`/assignments/${id}/weeks`).then(r => r.data);
 
+// -------- Cronogramas (media/alta complejidad, expandidos en el backend) --------
+export const getSchedule = (complexity) => api.get(`/schedules/${complexity}`).then(r => r.data);
+/** placement: "fixed" (empieza en start_date) | "auto" (primer inicio con disponibilidad); dry_run solo propone */
+export const createScheduledAssignment = (p) => api.post("/assignments/schedule", p).then(r => r.data);
+
+// -------- Lotes de cambios (rebalanceos en un solo request y una sola transacción) --------
+/** operations: [{ op: "create" | "update" | "delete", ... }] en orden; devuelve { results, cells } */
+export const applyBatch = (operations, { dryRun = false } = {}) =>
+  api.post("/batch", { operations, dry_run: dryRun }).then(r => r.data);
+
+// -------- Feed de cambios (SSE) --------
+/**
+ * Escucha /changes/stream. onChange recibe { projects, resources, cells: [[resource_id, week_monday,
+ * label, pct]], reload? }; onResync se llama al reconectar o cuando el servidor avisa que se perdieron
+ * eventos (hay que recargar). Devuelve la función para cerrar la conexión.
+ */
+export function subscribeChanges({ onChange, onResync, onStatus } = {}) {
+  const source = new EventSource(`${api.defaults.baseURL}/changes/stream`);
+  let connectedOnce = false;
+  source.addEventListener("ready", () => {
+    onStatus?.(true);
+    // EventSource reconecta solo; lo que pasó mientras estuvo caído no llega por el feed
+    if (connectedOnce) onResync?.();
+    connectedOnce = true;
+  });
+  source.addEventListener("change", (e) => onChange?.(JSON.parse(e.data)));
+  source.addEventListener("resync", () => onResync?.());
+  source.onerror = () => onStatus?.(false);
+  return () => source.close();
+}
+
 // -------- Resúmenes simples --------
 export const getResourcesSummary = () => api.get("/resources/summary").then(r => r.data);
 export const getProjectsSummary  = () => api.get("/projects/summary").then(r => r.data);
@@ -40,6 +71,14 @@ export async function getProjectsWeeklyAvg(startISO, weeks) {
   const { data } = await api.get("/projects/weekly-avg", { params: { start: startISO, weeks } });
   return data; // { labels, projects: [{name, avg_pct, by_week:{label:number}}] }
 }
+/** Todo lo que necesita refreshData en un solo request (mismas formas que los endpoints de arriba) */
+export async function getDashboard(startISO, weeks) {
+  const { data } = await api.get("/dashboard", { params: { start: startISO, weeks } });
+  return data; // { resources, projects, capacity, resources_vs, weekly_avg }
+}
+/** URLs de descarga (el backend arma y transmite el archivo; sin params exporta todo el historial) */
+export const exportCapacityXlsxUrl = (params = {}) => api.getUri({ url: "/export/capacity.xlsx", params });
+export const exportAssignmentsCsvUrl = (params = {}) => api.getUri({ url: "/export/assignments.csv", params });
 // Agrega esta función
 export const createBulkAssignments = (data) => {
   return api.post("/assignments/bulk", data);
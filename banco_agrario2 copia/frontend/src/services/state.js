@@ -4,9 +4,8 @@ import {
   api,
   createProject as apiCreateProject,
   createResource as apiCreateResource,
-  getCapacityWindow,
-  getResourcesVsWeekly,
-  getProjectsWeeklyAvg,
+  getDashboard,
+  subscribeChanges,
 } from "./api";
 
 /* ================= utils de fechas ================= */
@@ -19,12 +18,20 @@ const mondayOf = (d) => {
 };
 const todayMondayISO = () => mondayOf(new Date(Date.now()));
 
+// Cambios que llegan juntos (un import, un lote) se resuelven con una sola recarga
+const LIVE_REFRESH_DEBOUNCE_MS = 1500;
+let liveRefreshTimer = null;
+let liveUnsubscribe = null;
+
+// Si el valor es menor a 1, asumimos que está en formato decimal y lo convertimos a porcentaje
+// (la carga que llega por el feed en vivo pasa por aquí igual que la de refreshData)
+const toPercentage = (value) => value < 1 ? value * 100 : value;
+
 // Función para convertir valores decimales a porcentajes enteros
 const convertValuesToPercentage = (valuesMap) => {
   const converted = {};
   for (const [key, value] of Object.entries(valuesMap)) {
-    // Si el valor es menor a 1, asumimos que está en formato decimal y lo convertimos a porcentaje
-    converted[key] = value < 1 ? value * 100 : value;
+    converted[key] = toPercentage(value);
   }
   return converted;
 };
@@ -92,6 +99,10 @@ const useBA = create((set, get) => ({
   selectedProject: null,
   loadingSubprocesses: false,
   showSubprocessesModal: false,
+
+  // feed de cambios en vivo
+  dashboardWindow: { start: null, weeks: 52 },
+  liveConnected: false,
   // Setters para filtros
   setFiltroAssignment: (key, value) => {
     set(state => ({
@@ -221,26 +232,24 @@ const useBA = create((set, get) => ({
 
   /* =============== carga principal (desde backend) =============== */
   refreshData: async ({ start = todayMondayISO(), weeks = 52 } = {}) => {
+    set({ dashboardWindow: { start, weeks } });
     try {
-      // OBTENER RECURSOS Y PROYECTOS CON ID PRIMERO
-      const [resourcesResponse, projectsResponse] = await Promise.all([
-        api.get('/resources'),
-        api.get('/projects')
-      ]);
+      // UN SOLO REQUEST: recursos, proyectos y los tres grids de la ventana
+      const dash = await getDashboard(start, weeks);
 
       // Crear mapas de nombres a IDs
       const resourcesMap = {};
-      resourcesResponse.data.forEach(resource => {
+      (dash.resources || []).forEach(resource => {
         resourcesMap[resource.name] = resource.id;
       });
 
       const projectsMap = {};
-      projectsResponse.data.forEach(project => {
+      (dash.projects || []).forEach(project => {
         projectsMap[project.name] = project.id;
       });
 
       // 1) Capacidad (por recurso y semana)
-      const cap = await getCapacityWindow(start, weeks);
+      const cap = dash.capacity || {};
       const weeksCapacity = cap.labels || [];
       const byRes = cap.by_resource || {};
 
@@ -254,7 +263,7 @@ const useBA = create((set, get) => ({
           const availabilityByWeek = {};
           for (const [week, value] of Object.entries(byRes[name])) {
             // Convertir el valor de carga a porcentaje y luego calcular disponibilidad
-            const loadValue = value < 1 ? value * 100 : value;
+            const loadValue = toPercentage(value);
             availabilityByWeek[week] = Math.max(0, 100 - Number(loadValue || 0));
           }
           return {
@@ -265,7 +274,7 @@ const useBA = create((set, get) => ({
         });
 
       // 2) Recursos vs (para la página semanal por persona)
-      const rv = await getResourcesVsWeekly(start, weeks);
+      const rv = dash.resources_vs || {};
       const resourcesVsWeeklyWeeks  = rv.labels || [];
       const resourcesVsWeeklyTypes  = rv.types  || [];
       const people                  = rv.people || [];
@@ -274,7 +283,7 @@ const useBA = create((set, get) => ({
       const meses = Array.from(new Set((resourcesVsWeeklyWeeks || weeksCapacity).map(lb => String(lb).split(":")[0])));
 
       // 3) *** Asignación PM y PRO: por PROYECTO ***
-      const avg = await getProjectsWeeklyAvg(start, weeks);
+      const avg = dash.weekly_avg || {};
       const weeksAssignment = avg.labels || weeksCapacity;
 
       // Incluir el ID del proyecto en cada fila
@@ -291,7 +300,7 @@ const useBA = create((set, get) => ({
         .map(p => {
           const convertedByWeek = {};
           for (const [week, value] of Object.entries(p.by_week || {})) {
-            convertedByWeek[week] = value < 1 ? value * 100 : value;
+            convertedByWeek[week] = toPercentage(value);
           }
           return { 
             id: projectsMap[p.name],
@@ -356,6 +365,61 @@ const useBA = create((set, get) => ({
   // compat con tus páginas
   refreshMock: async () => get().refreshData(),
 
+  /* =============== cambios en vivo (SSE) =============== */
+  startLiveUpdates: () => {
+    if (liveUnsubscribe) return liveUnsubscribe;
+    liveUnsubscribe = subscribeChanges({
+      onChange: (change) => get().applyLiveChange(change),
+      onResync: () => get().scheduleLiveRefresh(),
+      onStatus: (connected) => set({ liveConnected: connected }),
+    });
+    return () => {
+      liveUnsubscribe?.();
+      liveUnsubscribe = null;
+      clearTimeout(liveRefreshTimer);
+      set({ liveConnected: false });
+    };
+  },
+
+  // Recarga la misma ventana que se está mostrando, una vez por ráfaga de cambios
+  scheduleLiveRefresh: () => {
+    clearTimeout(liveRefreshTimer);
+    liveRefreshTimer = setTimeout(() => {
+      const { start, weeks } = get().dashboardWindow;
+      get().refreshData(start ? { start, weeks } : {});
+    }, LIVE_REFRESH_DEBOUNCE_MS);
+  },
+
+  // Parcha ya las celdas de capacidad/disponibilidad; lo que depende de proyectos o del
+  // catálogo (promedios, recursos vs, filas nuevas) se pone al día con la recarga diferida
+  applyLiveChange: ({ cells = [], projects = [], resources = [], reload = false }) => {
+    if (cells.length) {
+      const byId = {};
+      for (const [rid, , label, pct] of cells) (byId[rid] ||= {})[label] = pct;
+      const visible = new Set(get().weeksCapacity);
+      set(state => ({
+        capacityRows: state.capacityRows.map(row => {
+          const patch = byId[row.id];
+          if (!patch) return row;
+          const values = { ...row.values };
+          for (const [label, pct] of Object.entries(patch)) if (visible.has(label)) values[label] = toPercentage(pct);
+          return { ...row, values };
+        }),
+        availabilityResources: state.availabilityResources.map(res => {
+          const patch = byId[res.id];
+          if (!patch) return res;
+          const availabilityByWeek = { ...res.availabilityByWeek };
+          for (const [label, pct] of Object.entries(patch)) {
+            if (visible.has(label)) availabilityByWeek[label] = Math.max(0, 100 - Number(toPercentage(pct) || 0));
+          }
+          return { ...res, availabilityByWeek };
+        }),
+      }));
+      get().aplicarFiltrosCapacity();
+    }
+    if (reload || projects.length || resources.length) get().scheduleLiveRefresh();
+  },
+
   /* =============== creadores =============== */
   createResource: async ({ nombre, area }) => {
     await apiCreateResource({ name: nombre, unit: area || "" });